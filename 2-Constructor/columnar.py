@@ -0,0 +1,422 @@
+"""
+Columnar Gradebook Documentation
+
+Overview:
+ColumnarGradebook stores students column by column instead of as one Student
+object per student. IDs, ages and grades live in compact typed arrays, and the
+per-student grade totals are kept up to date so that averages and approval
+status for the whole roster are computed in a single pass over two arrays.
+
+Columns:
+- ids: Student IDs (array of signed 64-bit integers)
+- ages: Student ages (array of unsigned 16-bit integers)
+- grades: Every grade of every student (array of unsigned bytes, 0-10 fits)
+- grade_start / grade_len: Where each student's initial grades are in grades
+- sums / counts: Running grade total and number of grades per student
+- names: Student names (list of strings)
+
+NumPy:
+When NumPy is installed, averages, approved_mask and cohort_stats view the
+columns through numpy.frombuffer (no copy) and compute them with whole-array
+operations. Without NumPy they fall back to one Python-level pass over the
+arrays: the columns still use far less memory than Student objects, but
+those methods are then about as fast as looping over a StudentRegistry.
+
+Methods:
+- add / add_rows / add_student / from_students: Append students to the gradebook
+- student: Returns a StudentView for a student ID
+- averages: Returns every student's average in one call
+- approved_mask: Returns a bytearray with 1 for approved students
+- cohort_stats: Returns statistics grouped by age
+
+Usage Example:
+book = ColumnarGradebook.from_students([Student("Juan", 1, 20, [10, 7, 6])])
+book.add("Pedro", 2, 21, [5, 3, 9])
+book.averages()            # array('d', [7.666..., 5.666...])
+book.approved_mask()       # bytearray(b'\\x01\\x00')
+book.student(2).add_note(10)
+book.student(2).see_info() # Same output as Student.see_info()
+"""
+
+from array import array
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+from grades import Student
+
+PASSING_AVERAGE = 6.0
+
+
+class StudentView:
+	"""
+	A lightweight view onto one row of a ColumnarGradebook.
+
+	It offers the same attributes and methods as Student, but reads and
+	writes the gradebook columns instead of holding its own data.
+
+	Attributes:
+		book (ColumnarGradebook): The gradebook holding the data
+		row (int): Row of the student in the gradebook
+	"""
+
+	__slots__ = ("book", "row")
+
+	def __init__(self, book, row):
+		"""
+		Initialize a new StudentView instance.
+
+		Args:
+			book (ColumnarGradebook): The gradebook holding the data
+			row (int): Row of the student in the gradebook
+		"""
+		self.book = book
+		self.row = row
+
+	@property
+	def name(self):
+		"""Get the student's name."""
+		return self.book.names[self.row]
+
+	@property
+	def id(self):
+		"""Get the student's ID."""
+		return self.book.ids[self.row]
+
+	@property
+	def age(self):
+		"""Get the student's age."""
+		return self.book.ages[self.row]
+
+	@property
+	def grades(self):
+		"""Get a copy of the student's grades as a list."""
+		return self.book.grades_of(self.row)
+
+	def average(self):
+		"""
+		Calculate the student's average from the running totals.
+
+		Returns:
+			float: The average grade, or 0.0 if the student has no grades
+		"""
+		count = self.book.counts[self.row]
+		if count == 0:
+			return 0.0
+		return self.book.sums[self.row] / count
+
+	def is_approved(self):
+		"""
+		Check if the student passes.
+
+		Returns:
+			bool: True if average >= 6.0, False otherwise
+		"""
+		return self.average() >= PASSING_AVERAGE
+
+	def add_note(self, grade):
+		"""
+		Add a valid grade to the student.
+
+		Args:
+			grade (int): Grade to add (must be 0-10)
+		"""
+		self.book.add_note(self.row, grade)
+
+	def info(self):
+		"""
+		Format the student information as a single line.
+
+		Returns:
+			str: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
+		"""
+		return f"Name: {self.name}, ID: {self.id}, Age: {self.age}, Grades: {self.grades}, Average: {self.average()}"
+
+	def see_info(self):
+		"""
+		Print formatted student information.
+
+		Output format: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
+		"""
+		print(self.info())
+
+
+class ColumnarGradebook:
+	"""
+	A class to store many students in contiguous typed arrays.
+
+	Grades given at creation time are stored back to back in the grades
+	array. Grades added later with add_note go to a small per-row overflow
+	array, so adding a grade never moves other students' data.
+
+	Attributes:
+		ids (array): Student IDs
+		ages (array): Student ages
+		names (list): Student names
+		grades (array): Initial grades of every student, back to back
+		grade_start (array): Offset of each student's first grade in grades
+		grade_len (array): Number of initial grades of each student
+		extra_grades (dict): Grades added after creation, keyed by row
+		sums (array): Running grade total of each student
+		counts (array): Number of grades of each student
+		rows (dict): Row of each student keyed by ID
+	"""
+
+	def __init__(self):
+		"""
+		Initialize a new, empty ColumnarGradebook instance.
+		"""
+		self.ids = array("q")
+		self.ages = array("H")
+		self.names : list[str] = []
+		self.grades = array("B")
+		self.grade_start = array("Q")
+		self.grade_len = array("H")
+		self.extra_grades : dict[int, array] = {}
+		self.sums = array("Q")
+		self.counts = array("L")
+		self.rows : dict[int, int] = {}
+
+	@classmethod
+	def from_students(cls, students):
+		"""
+		Build a gradebook from existing Student objects.
+
+		Args:
+			students (iterable): Student objects to copy into the gradebook
+
+		Returns:
+			ColumnarGradebook: The new gradebook
+		"""
+		book = cls()
+		for student in students:
+			book.add_student(student)
+		return book
+
+	def __len__(self):
+		"""Return the number of students."""
+		return len(self.ids)
+
+	def __contains__(self, id):
+		"""Check whether a student with the given ID is stored."""
+		return id in self.rows
+
+	def __iter__(self):
+		"""Iterate over a StudentView for every row."""
+		for row in range(len(self.ids)):
+			yield StudentView(self, row)
+
+	def add(self, name, id, age, grades):
+		"""
+		Append a student to the gradebook.
+
+		Like the Student constructor, the grades are dropped if any of
+		them is not a valid grade (non-integers such as 7.0 included).
+		Every value is converted before any column changes, so a rejected
+		student never leaves the columns out of step.
+
+		Args:
+			name (str): Student's name
+			id (int): Unique student ID
+			age (int): Student's age
+			grades (list): List of grades (0-10)
+
+		Returns:
+			int: Row of the new student
+
+		Raises:
+			KeyError: If a student with the same ID is already stored
+			TypeError: If the ID or the age is not an integer
+			OverflowError: If the ID or the age does not fit its column
+				(ages must be between 0 and 65535)
+		"""
+		if id in self.rows:
+			raise KeyError(f"The ID {id} already exists")
+		# Converting to the column types raises before anything is stored
+		array(self.ids.typecode, (id,))
+		array(self.ages.typecode, (age,))
+		if not all(grade in Student.grades_options for grade in grades):
+			grades = []
+		try:
+			grades = array(self.grades.typecode, grades)
+		except TypeError:
+			grades = array(self.grades.typecode)
+		row = len(self.ids)
+		self.ids.append(id)
+		self.ages.append(age)
+		self.names.append(name)
+		self.grade_start.append(len(self.grades))
+		self.grade_len.append(len(grades))
+		self.grades.extend(grades)
+		self.sums.append(sum(grades))
+		self.counts.append(len(grades))
+		self.rows[id] = row
+		return row
+
+	def add_student(self, student):
+		"""
+		Append a copy of a Student object to the gradebook.
+
+		Args:
+			student (Student): The student to copy
+
+		Returns:
+			int: Row of the new student
+		"""
+		return self.add(student.name, student.id, student.age, student.grades)
+
+	def add_rows(self, rows):
+		"""
+		Append students from (name, id, age, grades) rows.
+
+		Args:
+			rows (iterable): Tuples of (name, id, age, grades)
+		"""
+		for name, id, age, grades in rows:
+			self.add(name, id, age, grades)
+
+	def student(self, id):
+		"""
+		Get a view of the student with the given ID.
+
+		Args:
+			id (int): ID of the student
+
+		Returns:
+			StudentView: The view, or None if no student has that ID
+		"""
+		row = self.rows.get(id)
+		if row is None:
+			return None
+		return StudentView(self, row)
+
+	def grades_of(self, row):
+		"""
+		Get every grade of the student in a row.
+
+		Args:
+			row (int): Row of the student
+
+		Returns:
+			list: The student's grades in the order they were added
+		"""
+		start = self.grade_start[row]
+		grades = self.grades[start:start + self.grade_len[row]].tolist()
+		extra = self.extra_grades.get(row)
+		if extra is not None:
+			grades.extend(extra)
+		return grades
+
+	def add_note(self, row, grade):
+		"""
+		Add a valid grade to the student in a row.
+
+		Args:
+			row (int): Row of the student
+			grade (int): Grade to add (must be 0-10)
+		"""
+		if grade in Student.grades_options:
+			extra = self.extra_grades.get(row)
+			if extra is None:
+				extra = self.extra_grades[row] = array("B")
+			extra.append(grade)
+			self.sums[row] += grade
+			self.counts[row] += 1
+
+	def _column(self, column):
+		"""View an array column as a NumPy array sharing its memory."""
+		return numpy.frombuffer(column, dtype=column.typecode)
+
+	def _numpy_averages(self):
+		"""Compute every average with NumPy (0.0 for students without grades)."""
+		sums = self._column(self.sums)
+		counts = self._column(self.counts)
+		return numpy.divide(sums, counts, out=numpy.zeros(len(counts)), where=counts > 0)
+
+	def _numpy_approved(self):
+		"""Compute the approval status of every student with NumPy, as booleans."""
+		sums = self._column(self.sums)
+		counts = self._column(self.counts)
+		return (counts > 0) & (sums >= PASSING_AVERAGE * counts)
+
+	def averages(self):
+		"""
+		Compute the average of every student.
+
+		Uses NumPy when it is installed, and one Python-level pass otherwise.
+
+		Returns:
+			array: Averages in row order (0.0 for students without grades)
+		"""
+		if numpy is None or not self.ids:
+			return array("d", [total / count if count else 0.0 for total, count in zip(self.sums, self.counts)])
+		averages = array("d")
+		averages.frombytes(self._numpy_averages().tobytes())
+		return averages
+
+	def approved_mask(self):
+		"""
+		Compute the approval status of every student.
+
+		The comparison is done on the totals (sum >= 6 * count), which gives
+		the same result as average() >= 6.0. Uses NumPy when it is installed,
+		and one Python-level pass otherwise.
+
+		Returns:
+			bytearray: 1 for approved students and 0 otherwise, in row order
+		"""
+		if numpy is None or not self.ids:
+			return bytearray(count > 0 and total >= PASSING_AVERAGE * count for total, count in zip(self.sums, self.counts))
+		return bytearray(self._numpy_approved().tobytes())
+
+	def approved_count(self):
+		"""
+		Count the approved students.
+
+		Returns:
+			int: Number of students with an average >= 6.0
+		"""
+		return sum(self.approved_mask())
+
+	def cohort_stats(self):
+		"""
+		Compute statistics for each age cohort.
+
+		Uses NumPy when it is installed, and one Python-level pass otherwise.
+
+		Returns:
+			dict: For each age, in order of first appearance, a dict with the
+			number of students, the number of approved students and the mean
+			of their averages
+		"""
+		if numpy is not None and self.ids:
+			return self._numpy_cohort_stats()
+		stats : dict[int, dict] = {}
+		for age, average, approved in zip(self.ages, self.averages(), self.approved_mask()):
+			cohort = stats.get(age)
+			if cohort is None:
+				cohort = stats[age] = {"students": 0, "approved": 0, "mean_average": 0.0}
+			cohort["students"] += 1
+			cohort["approved"] += approved
+			cohort["mean_average"] += average
+		for cohort in stats.values():
+			cohort["mean_average"] /= cohort["students"]
+		return stats
+
+	def _numpy_cohort_stats(self):
+		"""Compute cohort_stats with NumPy by counting per age with bincount."""
+		ages = self._column(self.ages)
+		students = numpy.bincount(ages)
+		approved = numpy.bincount(ages, weights=self._numpy_approved())
+		totals = numpy.bincount(ages, weights=self._numpy_averages())
+		present, first = numpy.unique(ages, return_index=True)
+		return {
+			int(age): {
+				"students": int(students[age]),
+				"approved": int(approved[age]),
+				"mean_average": float(totals[age] / students[age]),
+			}
+			for age in present[numpy.argsort(first)]
+		}
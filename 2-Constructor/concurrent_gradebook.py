@@ -0,0 +1,219 @@
+"""
+Concurrent Gradebook Documentation
+
+Overview:
+ConcurrentGradebook lets several threads add students, post grades and read
+averages at the same time. Students are spread over lock stripes by ID: each
+stripe has its own lock, its own students and its own approved counter, so
+threads working on students of different stripes never wait for each other.
+
+Locking Rules:
+- A student is only read or changed while holding the lock of its stripe,
+  so readers never see a grade list that is half updated
+- Operations that need several stripes take their locks in stripe order,
+  which prevents deadlocks
+- post_grades groups the grades by stripe and takes each lock only once
+- Invalid grades (outside Student.grades_options) are dropped before any
+  lock is taken, and are not counted as posted
+
+Usage Example:
+book = ConcurrentGradebook([Student("Juan", 1, 20, [10, 7, 6])])
+book.post_grades([(1, 9), (1, 4)])  # Safe to call from several threads
+book.snapshot(1)                      # Consistent copy of the student
+book.approved_count()
+"""
+
+import threading
+from collections import namedtuple
+
+from grades import Student
+
+VALID_GRADES = frozenset(Student.grades_options)
+
+StudentSnapshot = namedtuple("StudentSnapshot", ["name", "id", "age", "grades", "average", "approved"])
+
+DEFAULT_STRIPES = 64
+
+
+class ConcurrentGradebook:
+	"""
+	A class to share students between threads with striped locking.
+
+	Attributes:
+		stripes (int): Number of lock stripes
+	"""
+
+	def __init__(self, students=(), stripes=DEFAULT_STRIPES):
+		"""
+		Initialize a new ConcurrentGradebook instance.
+
+		Args:
+			students (iterable): Students to add initially
+			stripes (int): Number of lock stripes
+		"""
+		self.stripes = stripes
+		self._locks = [threading.Lock() for _ in range(stripes)]
+		self._students : list[dict] = [{} for _ in range(stripes)]
+		self._approved = [0] * stripes
+		for student in students:
+			self.add(student)
+
+	def _stripe(self, id):
+		"""Get the stripe that holds a student ID."""
+		return hash(id) % self.stripes
+
+	def add(self, student):
+		"""
+		Add a student.
+
+		Args:
+			student (Student): The student to add
+
+		Raises:
+			KeyError: If a student with the same ID was already added
+		"""
+		stripe = self._stripe(student.id)
+		with self._locks[stripe]:
+			students = self._students[stripe]
+			if student.id in students:
+				raise KeyError(f"The ID {student.id} already exists")
+			students[student.id] = student
+			if student.is_approved():
+				self._approved[stripe] += 1
+
+	def remove(self, id):
+		"""
+		Remove the student with the given ID.
+
+		Args:
+			id (int): ID of the student
+
+		Returns:
+			Student: The removed student
+
+		Raises:
+			KeyError: If no student has that ID
+		"""
+		stripe = self._stripe(id)
+		with self._locks[stripe]:
+			student = self._students[stripe].pop(id)
+			if student.is_approved():
+				self._approved[stripe] -= 1
+			return student
+
+	def __len__(self):
+		"""Return the number of students."""
+		return sum(len(students) for students in self._students)
+
+	def _add_note(self, stripe, student, grade):
+		"""Add a grade to a student while the stripe lock is held."""
+		was_approved = student.is_approved()
+		student.add_note(grade)
+		is_approved = student.is_approved()
+		if is_approved != was_approved:
+			self._approved[stripe] += 1 if is_approved else -1
+
+	def add_note(self, id, grade):
+		"""
+		Add a grade to a student.
+
+		Args:
+			id (int): ID of the student
+			grade (int): Grade to add (must be 0-10)
+
+		Returns:
+			bool: True if the grade was added, False if the grade is invalid
+			or the student does not exist
+		"""
+		if grade not in VALID_GRADES:
+			return False
+		stripe = self._stripe(id)
+		with self._locks[stripe]:
+			student = self._students[stripe].get(id)
+			if student is None:
+				return False
+			self._add_note(stripe, student, grade)
+			return True
+
+	def post_grades(self, postings):
+		"""
+		Add many grades, taking the lock of each stripe only once.
+
+		Args:
+			postings (iterable): (id, grade) pairs
+
+		Returns:
+			int: Number of valid grades posted to existing students
+		"""
+		batches : dict[int, list] = {}
+		for id, grade in postings:
+			if grade not in VALID_GRADES:
+				continue
+			batches.setdefault(self._stripe(id), []).append((id, grade))
+		posted = 0
+		for stripe in sorted(batches):
+			with self._locks[stripe]:
+				students = self._students[stripe]
+				for id, grade in batches[stripe]:
+					student = students.get(id)
+					if student is not None:
+						self._add_note(stripe, student, grade)
+						posted += 1
+		return posted
+
+	def _snapshot(self, student):
+		"""Copy a student while the stripe lock is held."""
+		return StudentSnapshot(student.name, student.id, student.age, tuple(student.grades), student.average(), student.is_approved())
+
+	def snapshot(self, id):
+		"""
+		Get a consistent copy of a student.
+
+		Args:
+			id (int): ID of the student
+
+		Returns:
+			StudentSnapshot: The copy, or None if no student has that ID
+		"""
+		stripe = self._stripe(id)
+		with self._locks[stripe]:
+			student = self._students[stripe].get(id)
+			if student is None:
+				return None
+			return self._snapshot(student)
+
+	def _all_locks(self):
+		"""Acquire every stripe lock in order; the caller must release them."""
+		for lock in self._locks:
+			lock.acquire()
+
+	def _release_all(self):
+		"""Release every stripe lock."""
+		for lock in reversed(self._locks):
+			lock.release()
+
+	def snapshot_all(self):
+		"""
+		Get a consistent copy of every student at a single point in time.
+
+		Returns:
+			list: A StudentSnapshot per student
+		"""
+		self._all_locks()
+		try:
+			return [self._snapshot(student) for students in self._students for student in students.values()]
+		finally:
+			self._release_all()
+
+	def approved_count(self):
+		"""
+		Count the approved students at a single point in time.
+
+		Returns:
+			int: Number of students with an average >= 6.0
+		"""
+		self._all_locks()
+		try:
+			return sum(self._approved)
+		finally:
+			self._release_all()
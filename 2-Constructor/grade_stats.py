@@ -0,0 +1,249 @@
+"""
+Grade Statistics Documentation
+
+Overview:
+This module keeps aggregate statistics of a StudentRegistry up to date as
+students and grades are added, instead of recomputing them for every report.
+
+Classes:
+- GradeHistogram: Counts how many times each grade (0-10) was given and
+  derives exact percentiles from the counts
+- AverageRanking: Two heaps of students ordered by average, answering top-k
+  and bottom-k queries without sorting the whole roster
+- GradeStats: Subscribes to a StudentRegistry and keeps a histogram and a
+  ranking in sync with it
+
+Usage Example:
+registry = StudentRegistry([Student("Juan", 1, 20, [10, 7, 6])])
+stats = GradeStats(registry)
+registry.get(1).add_note(9)    # The statistics are updated automatically
+stats.histogram.percentile(50) # Median grade
+stats.ranking.top(3)           # Three best students by average
+"""
+
+import heapq
+import math
+
+from grades import Student
+
+
+class GradeHistogram:
+	"""
+	A class to count grades in the fixed 0-10 range.
+
+	Attributes:
+		counts (list): Number of times each grade was given, indexed by grade
+		total (int): Number of grades counted
+	"""
+
+	def __init__(self):
+		"""
+		Initialize a new, empty GradeHistogram instance.
+		"""
+		self.counts = [0] * len(Student.grades_options)
+		self.total = 0
+
+	def add(self, grade, times=1):
+		"""
+		Count a grade.
+
+		Args:
+			grade (int): The grade (0-10)
+			times (int): How many times to count it
+		"""
+		self.counts[grade] += times
+		self.total += times
+
+	def remove(self, grade, times=1):
+		"""
+		Stop counting a grade.
+
+		Args:
+			grade (int): The grade (0-10)
+			times (int): How many times to remove it
+		"""
+		self.counts[grade] -= times
+		self.total -= times
+
+	def mean(self):
+		"""
+		Calculate the mean of every counted grade.
+
+		Returns:
+			float: The mean grade, or 0.0 if nothing was counted
+		"""
+		if self.total == 0:
+			return 0.0
+		return sum(grade * count for grade, count in enumerate(self.counts)) / self.total
+
+	def percentile(self, percent):
+		"""
+		Get the exact percentile of the counted grades (nearest-rank method).
+
+		Args:
+			percent (float): Percentile between 0 and 100
+
+		Returns:
+			int: The smallest grade such that at least percent% of the
+			grades are lower or equal, or None if nothing was counted
+
+		Raises:
+			ValueError: If percent is not between 0 and 100
+		"""
+		if not 0 <= percent <= 100:
+			raise ValueError("Percent must be between 0 and 100")
+		if self.total == 0:
+			return None
+		rank = max(1, math.ceil(percent / 100 * self.total))
+		seen = 0
+		for grade, count in enumerate(self.counts):
+			seen += count
+			if seen >= rank:
+				return grade
+
+
+class AverageRanking:
+	"""
+	A class to rank students by average with a max-heap and a min-heap.
+
+	When a student's average changes a new heap entry is pushed and the old
+	one becomes stale. Stale entries are skipped when they reach the top of
+	a heap, and the heaps are rebuilt when stale entries outnumber live ones.
+
+	Attributes:
+		students (dict): Ranked students keyed by ID
+		versions (dict): Current entry version of each student, keyed by ID
+	"""
+
+	def __init__(self):
+		"""
+		Initialize a new, empty AverageRanking instance.
+		"""
+		self.students : dict[int, Student] = {}
+		self.versions : dict[int, int] = {}
+		self._best = []
+		self._worst = []
+		self._next_version = 0
+
+	def __len__(self):
+		"""Return the number of ranked students."""
+		return len(self.students)
+
+	def update(self, student):
+		"""
+		Add a student to the ranking, or refresh their position.
+
+		Args:
+			student (Student): The student to rank
+		"""
+		version = self._next_version
+		self._next_version += 1
+		self.students[student.id] = student
+		self.versions[student.id] = version
+		average = student.average()
+		heapq.heappush(self._best, (-average, student.id, version))
+		heapq.heappush(self._worst, (average, student.id, version))
+		if len(self._best) > 2 * len(self.students) + 64:
+			self._rebuild()
+
+	def remove(self, student):
+		"""
+		Remove a student from the ranking.
+
+		Args:
+			student (Student): The student to remove
+		"""
+		del self.students[student.id]
+		del self.versions[student.id]
+
+	def top(self, k):
+		"""
+		Get the k students with the highest average.
+
+		Args:
+			k (int): Number of students
+
+		Returns:
+			list: Up to k students, best first (ties broken by lowest ID)
+		"""
+		return self._first(self._best, k)
+
+	def bottom(self, k):
+		"""
+		Get the k students with the lowest average.
+
+		Args:
+			k (int): Number of students
+
+		Returns:
+			list: Up to k students, worst first (ties broken by lowest ID)
+		"""
+		return self._first(self._worst, k)
+
+	def _first(self, heap, k):
+		"""Pop the first k live entries of a heap, then push them back."""
+		live = []
+		while heap and len(live) < k:
+			entry = heapq.heappop(heap)
+			if self.versions.get(entry[1]) == entry[2]:
+				live.append(entry)
+		for entry in live:
+			heapq.heappush(heap, entry)
+		return [self.students[entry[1]] for entry in live]
+
+	def _rebuild(self):
+		"""Rebuild both heaps from the live entries only."""
+		self._best = []
+		self._worst = []
+		for id, student in self.students.items():
+			average = student.average()
+			self._best.append((-average, id, self.versions[id]))
+			self._worst.append((average, id, self.versions[id]))
+		heapq.heapify(self._best)
+		heapq.heapify(self._worst)
+
+
+class GradeStats:
+	"""
+	A class to keep a histogram and a ranking in sync with a registry.
+
+	Attributes:
+		registry (StudentRegistry): The observed registry
+		histogram (GradeHistogram): Every grade of every registered student
+		ranking (AverageRanking): Registered students ranked by average
+	"""
+
+	def __init__(self, registry):
+		"""
+		Initialize a new GradeStats instance and subscribe to the registry.
+
+		Args:
+			registry (StudentRegistry): The registry to observe
+		"""
+		self.registry = registry
+		self.histogram = GradeHistogram()
+		self.ranking = AverageRanking()
+		for student in registry:
+			self.student_added(student)
+		registry.subscribe(self)
+
+	def close(self):
+		"""Stop observing the registry."""
+		self.registry.unsubscribe(self)
+
+	def student_added(self, student):
+		"""Count the grades of a new student and rank them."""
+		for grade in student.grades:
+			self.histogram.add(grade)
+		self.ranking.update(student)
+
+	def student_removed(self, student):
+		"""Forget the grades and the rank of a removed student."""
+		for grade in student.grades:
+			self.histogram.remove(grade)
+		self.ranking.remove(student)
+
+	def grade_added(self, student, grade, was_approved):
+		"""Count a new grade and refresh the student's rank."""
+		self.histogram.add(grade)
+		self.ranking.update(student)
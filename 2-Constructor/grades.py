@@ -7,24 +7,44 @@ The Student class manages student information including grades, calculates avera
 Class Attributes:
 - grades_options: List of valid grades (0-10)
 - grades: List of student's grades
+- grade_sum / grade_count: Running total and number of grades
 - name: Student's name (string)
 - id: Student's unique identifier (integer)
 - age: Student's age (integer)
 
 Methods:
 - __init__: Constructor - Initializes a new student
-- average: Returns arithmetic mean of all grades
+- average: Returns arithmetic mean of all grades (0.0 when there are none)
 - is_approved: Returns True if average >= 6.0, False otherwise
-- add_note: Appends valid grade to student's grade list
+- add_note: Appends valid grade to student's grade list and updates the running total
+- info: Returns the formatted student information
 - see_info: Prints formatted student information
 
+StudentRegistry:
+- Stores students in a dictionary keyed by ID, plus a name index
+- add / add_many / add_rows / remove / get / find_by_name run in constant time per student
+- approved_count: Number of approved students, kept up to date as grades are added
+- subscribe / unsubscribe: Notify observers when students or grades are added
+
+Synthetic Data:
+- generate_student_rows: Seeded generator of (name, id, age, grades) rows
+- generate_students: Same data as Student objects
+
 Usage Example:
 student = Student("John", 1, 20, [8, 7, 9])
 student.add_note(10)
 student.see_info()  # Prints student details
 print(student.is_approved())  # True (average = 8.5)
+
+registry = StudentRegistry([student])
+registry.get(1)  # Returns the student with ID 1 without scanning
 """
 
+import random
+import sys
+
+from reports import write_report
+
 class Student:
 	"""
 	A class to represent a student with grades and approval status.
@@ -32,13 +52,18 @@ class Student:
 	Attributes:
 		grades_options (list): Valid grade range (0-10)
 		grades (list): Student's grades
+		grade_sum (int): Running total of the grades
+		grade_count (int): Number of grades
 		name (str): Student's name
 		id (int): Unique student identifier
 		age (int): Student's age
+		listeners (list): Callables notified as listener(student, grade, was_approved) after a grade is added
 	"""
 
 	grades_options = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 	grades : list[int]
+	grade_sum : int
+	grade_count : int
 	name : str
 	id : int
 	age : int
@@ -57,16 +82,24 @@ class Student:
 		self.name = name
 		self.id = id 
 		self.age = age
-		self.grades = grades if all(grade in self.grades_options for grade in grades) else []
+		self.grades = list(grades) if all(grade in self.grades_options for grade in grades) else []
+		self.grade_sum = sum(self.grades)
+		self.grade_count = len(self.grades)
+		self.listeners = []
 
 	def average(self):
 		"""
 		Calculate the arithmetic mean of all grades.
 		
+		The running total is kept by the constructor and add_note, so this
+		does not traverse the grades.
+		
 		Returns:
-			float: The average grade
+			float: The average grade, or 0.0 if the student has no grades
 		"""
-		return sum(self.grades) / len(self.grades)
+		if self.grade_count == 0:
+			return 0.0
+		return self.grade_sum / self.grade_count
 
 	def is_approved(self):
 		"""
@@ -85,79 +118,311 @@ class Student:
 			grade (int): Grade to add (must be 0-10)
 		"""
 		if grade in self.grades_options:
+			was_approved = self.is_approved()
 			self.grades.append(grade)
+			self.grade_sum += grade
+			self.grade_count += 1
+			for listener in self.listeners:
+				listener(self, grade, was_approved)
 	
+	def info(self):
+		"""
+		Format the student information as a single line.
+		
+		Returns:
+			str: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
+		"""
+		return f"Name: {self.name}, ID: {self.id}, Age: {self.age}, Grades: {self.grades}, Average: {self.average()}"
+
 	def see_info(self):
 		"""
 		Print formatted student information.
 		
 		Output format: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
 		"""
-		print(f"Name: {self.name}, ID: {self.id}, Age: {self.age}, Grades: {self.grades}, Average: {self.average()}")
-
-
-student1 = Student("Juan", 1, 20, [10, 7, 6])
-student2 = Student("Pedro", 2, 21, [5, 3, 9])
-student3 = Student("Maria", 3, 22, [7, 3, 6])
-
-students : list[Student] = [student1, student2, student3]
-
-while True:
-
-	print("--------------------------------")
-	print("1. Add student")
-	print("2. See students")
-	print("3. Add grade")
-	print("4. See student info")
-	print("5. Check if approved")
-	print("6. Exit")
-
-	opcion = int(input("Enter an option: "))
-
-	if opcion == 1:
-		name = input("Enter the student name: ")
-		while True:
-			try:
-				id = int(input("Enter the student ID: "))
-				if id <= 0:
-					print("Invalid ID. Please enter a positive number.")
-					continue
-				if any(student.id == id for student in students):
-					print("The ID already exists. Please enter a different ID.")
-					continue
-				break
-			except ValueError:
-				print("Invalid ID. Please enter a valid number.")
-		age = int(input("Enter the student age: "))
-		print("Enter the student grades: ")
-		grades : list[int] = []
-
-		for i in range(3):
+		print(self.info())
+
+
+class StudentRegistry:
+	"""
+	A class to store students indexed by ID and by name.
+
+	Students are kept in a dictionary keyed by ID, so adding, removing and
+	looking up a student takes constant time instead of scanning a list.
+	A secondary index groups students that share the same name.
+
+	The registry listens to the grades added to its students, so the
+	number of approved students is always available without a scan.
+	Observers can subscribe to be told when students are added or removed
+	and when a registered student receives a grade.
+
+	Attributes:
+		by_id (dict): Students keyed by their ID
+		by_name (dict): Students keyed by name, then by ID
+		approved (int): Number of registered students that are approved
+		observers (list): Objects with student_added(student),
+			student_removed(student) and grade_added(student, grade, was_approved)
+	"""
+
+	def __init__(self, students=()):
+		"""
+		Initialize a new StudentRegistry instance.
+
+		Args:
+			students (iterable): Students to register initially
+		"""
+		self.by_id : dict[int, Student] = {}
+		self.by_name : dict[str, dict[int, Student]] = {}
+		self.approved = 0
+		self.observers = []
+		self.add_many(students)
+
+	def __len__(self):
+		"""Return the number of registered students."""
+		return len(self.by_id)
+
+	def __iter__(self):
+		"""Iterate over the students in insertion order."""
+		return iter(self.by_id.values())
+
+	def __contains__(self, id):
+		"""Check whether a student with the given ID is registered."""
+		return id in self.by_id
+
+	def add(self, student):
+		"""
+		Register a student.
+
+		Args:
+			student (Student): The student to register
+
+		Raises:
+			KeyError: If a student with the same ID is already registered
+		"""
+		if student.id in self.by_id:
+			raise KeyError(f"The ID {student.id} already exists")
+		self.by_id[student.id] = student
+		self.by_name.setdefault(student.name, {})[student.id] = student
+		student.listeners.append(self._grade_added)
+		if student.is_approved():
+			self.approved += 1
+		for observer in self.observers:
+			observer.student_added(student)
+
+	def add_many(self, students):
+		"""
+		Register several students at once.
+
+		Args:
+			students (iterable): The students to register
+		"""
+		for student in students:
+			self.add(student)
+
+	def add_rows(self, rows):
+		"""
+		Register students built from (name, id, age, grades) rows.
+		
+		Args:
+			rows (iterable): Tuples of (name, id, age, grades)
+		"""
+		for name, id, age, grades in rows:
+			self.add(Student(name, id, age, grades))
+
+	def remove(self, id):
+		"""
+		Unregister the student with the given ID.
+
+		Args:
+			id (int): ID of the student to remove
+
+		Returns:
+			Student: The removed student
+
+		Raises:
+			KeyError: If no student has that ID
+		"""
+		student = self.by_id.pop(id)
+		namesakes = self.by_name[student.name]
+		del namesakes[id]
+		if not namesakes:
+			del self.by_name[student.name]
+		student.listeners.remove(self._grade_added)
+		if student.is_approved():
+			self.approved -= 1
+		for observer in self.observers:
+			observer.student_removed(student)
+		return student
+
+	def get(self, id):
+		"""
+		Look up a student by ID.
+
+		Args:
+			id (int): ID of the student
+
+		Returns:
+			Student: The student, or None if no student has that ID
+		"""
+		return self.by_id.get(id)
+
+	def find_by_name(self, name):
+		"""
+		Look up every student with the given name.
+
+		Args:
+			name (str): Name to search for
+
+		Returns:
+			list: Students with that name (empty if there are none)
+		"""
+		return list(self.by_name.get(name, {}).values())
+
+	def approved_count(self):
+		"""
+		Get the number of approved students.
+		
+		Returns:
+			int: How many registered students have an average >= 6.0
+		"""
+		return self.approved
+
+	def subscribe(self, observer):
+		"""
+		Start notifying an observer of changes to the registry.
+		
+		Args:
+			observer: Object with student_added, student_removed and grade_added methods
+		"""
+		self.observers.append(observer)
+
+	def unsubscribe(self, observer):
+		"""
+		Stop notifying an observer of changes to the registry.
+		
+		Args:
+			observer: An observer previously passed to subscribe
+		"""
+		self.observers.remove(observer)
+
+	def _grade_added(self, student, grade, was_approved):
+		"""Update the approved count after a student receives a grade."""
+		is_approved = student.is_approved()
+		if is_approved != was_approved:
+			self.approved += 1 if is_approved else -1
+		for observer in self.observers:
+			observer.grade_added(student, grade, was_approved)
+
+
+FIRST_NAMES = ["Juan", "Pedro", "Maria", "Ana", "Lucia", "Carlos", "Sofia", "Diego", "Valentina", "Mateo"]
+
+
+def generate_student_rows(n, seed=None, start_id=1, ages=(18, 30), grades_per_student=(3, 3), grade_weights=None):
+	"""
+	Generate reproducible (name, id, age, grades) rows for load testing.
+	
+	Rows are produced one at a time, so memory use does not depend on n.
+	They can be given to StudentRegistry.add_rows or ColumnarGradebook.add_rows.
+	
+	Args:
+		n (int): Number of rows
+		seed (int): Random seed; the same seed always gives the same rows
+		start_id (int): ID of the first student (IDs are consecutive)
+		ages (tuple): Inclusive (lowest, highest) age
+		grades_per_student (tuple): Inclusive (lowest, highest) number of grades
+		grade_weights (list): Relative weight of each grade 0-10 (uniform if None)
+	
+	Yields:
+		tuple: (name, id, age, grades)
+	"""
+	rng = random.Random(seed)
+	min_age, max_age = ages
+	min_grades, max_grades = grades_per_student
+	for id in range(start_id, start_id + n):
+		count = rng.randint(min_grades, max_grades)
+		grades = rng.choices(Student.grades_options, grade_weights, k=count)
+		yield rng.choice(FIRST_NAMES), id, rng.randint(min_age, max_age), grades
+
+
+def generate_students(n, seed=None, **distribution):
+	"""
+	Generate reproducible Student objects for load testing.
+	
+	Args:
+		n (int): Number of students
+		seed (int): Random seed
+		**distribution: Same options as generate_student_rows
+	
+	Yields:
+		Student: The next generated student
+	"""
+	for name, id, age, grades in generate_student_rows(n, seed, **distribution):
+		yield Student(name, id, age, grades)
+
+
+def main():
+	"""Run the interactive student grade menu."""
+	student1 = Student("Juan", 1, 20, [10, 7, 6])
+	student2 = Student("Pedro", 2, 21, [5, 3, 9])
+	student3 = Student("Maria", 3, 22, [7, 3, 6])
+
+	students = StudentRegistry([student1, student2, student3])
+
+	while True:
+
+		print("--------------------------------")
+		print("1. Add student")
+		print("2. See students")
+		print("3. Add grade")
+		print("4. See student info")
+		print("5. Check if approved")
+		print("6. Exit")
+
+		opcion = int(input("Enter an option: "))
+
+		if opcion == 1:
+			name = input("Enter the student name: ")
 			while True:
-				grade = int(input(f"Enter the grade {i+1}: "))
-				if grade in Student.grades_options:
-					grades.append(grade)
+				try:
+					id = int(input("Enter the student ID: "))
+					if id <= 0:
+						print("Invalid ID. Please enter a positive number.")
+						continue
+					if id in students:
+						print("The ID already exists. Please enter a different ID.")
+						continue
 					break
-				else:
-					print("Invalid grade. Please enter a grade between 0 and 10.")
+				except ValueError:
+					print("Invalid ID. Please enter a valid number.")
+			age = int(input("Enter the student age: "))
+			print("Enter the student grades: ")
+			grades : list[int] = []
 
-		student : Student = Student(name, id, age, grades)
-		students.append(student)
+			for i in range(3):
+				while True:
+					grade = int(input(f"Enter the grade {i+1}: "))
+					if grade in Student.grades_options:
+						grades.append(grade)
+						break
+					else:
+						print("Invalid grade. Please enter a grade between 0 and 10.")
 
-	if opcion == 2:
-		if len(students) == 0:
-			print("No students")
-		else:
-			for student in students:
-				student.see_info()
+			student : Student = Student(name, id, age, grades)
+			students.add(student)
 
-	if opcion == 3 or opcion == 4 or opcion == 5:
-		id = int(input("Enter the student ID: "))
-		student_found = False
+		if opcion == 2:
+			if len(students) == 0:
+				print("No students")
+			else:
+				write_report(students, sys.stdout)
 
-		for student in students:
-			if student.id == id:
-				student_found = True
+		if opcion == 3 or opcion == 4 or opcion == 5:
+			id = int(input("Enter the student ID: "))
+			student = students.get(id)
+
+			if student is None:
+				print("Student not found with that ID.")
+			else:
 				if opcion == 3:
 					grade = int(input("Enter the grade: "))
 					student.add_note(grade)
@@ -169,10 +434,9 @@ while True:
 						print(f"The student passed with {student.average()}")
 					else:
 						print(f"The student did not pass with {student.average()}")
-				break
-		
-		if not student_found:
-			print("Student not found with that ID.")
 
-	if opcion == 6:
-		break
\ No newline at end of file
+		if opcion == 6:
+			break
+
+if __name__ == "__main__":
+	main()
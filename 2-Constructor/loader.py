@@ -0,0 +1,198 @@
+"""
+Bulk Student Loader Documentation
+
+Overview:
+This module loads students from CSV or JSON Lines files without going through
+the interactive menu of grades.py. Files are read as a stream, validated in
+chunks and inserted chunk by chunk, so memory use depends on the chunk size
+and not on the size of the file.
+
+File Formats:
+- CSV (.csv): name,id,age,grade,grade,... (one grade per column, any number
+  of grade columns). A first row starting with "name" is treated as a header.
+- JSON Lines (.jsonl): {"name": "Juan", "id": 1, "age": 20, "grades": [10, 7, 6]}
+
+Functions:
+- read_rows: Generator of (name, id, age, grades) tuples read from a file
+- iter_chunks: Groups any iterable into lists of a fixed size
+- load_students: Validates rows and inserts them into a roster
+
+Validation:
+- Lines that cannot be parsed (bad numbers, missing fields, malformed JSON)
+  are rejected as "invalid" instead of stopping the import
+- IDs, ages and grades must be integers: values such as 7.9, "7.9" or true
+  are rejected, never truncated
+- Every grade must be one of Student.grades_options, otherwise the row is rejected
+- Ages must be between 0 and MAX_AGE
+- IDs must be positive (up to MAX_ID) and unique: duplicates are detected with
+  the roster's ID index and a set of the IDs seen in the current chunk, never by a scan
+
+Usage Example:
+registry = StudentRegistry()
+report = load_students("students.csv", registry)
+print(report)  # {'loaded': 3, 'invalid': 0, 'duplicates': 0}
+
+Command line:
+python loader.py students.csv
+"""
+
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from grades import Student, StudentRegistry
+
+VALID_GRADES = frozenset(Student.grades_options)
+MAX_AGE = 150
+# Largest ID that fits every roster (ColumnarGradebook stores signed 64-bit IDs)
+MAX_ID = 2 ** 63 - 1
+
+
+PARSE_ERRORS = (ValueError, IndexError, KeyError, TypeError)
+
+
+def _integer(value):
+	"""
+	Check that a JSON value is an integer.
+
+	Raises:
+		TypeError: If the value is not an int (floats and booleans included)
+	"""
+	if type(value) is not int:
+		raise TypeError(f"Expected an integer, got {value!r}")
+	return value
+
+
+def _parse_csv(row):
+	"""Convert a CSV row into a (name, id, age, grades) tuple."""
+	return row[0], int(row[1]), int(row[2]), [int(grade) for grade in row[3:] if grade]
+
+
+def _parse_jsonl(line):
+	"""Convert a JSON Lines record into a (name, id, age, grades) tuple."""
+	record = json.loads(line)
+	if not isinstance(record["name"], str):
+		raise TypeError(f"Expected a name, got {record['name']!r}")
+	return record["name"], _integer(record["id"]), _integer(record["age"]), [_integer(grade) for grade in record["grades"]]
+
+
+def read_rows(path, on_error=None):
+	"""
+	Stream (name, id, age, grades) tuples from a CSV or JSON Lines file.
+
+	Args:
+		path (str): Path to a .csv or .jsonl file
+		on_error (callable): Called as on_error(raw, error) for every line
+			that cannot be parsed, which is then skipped; without it the
+			parse error is raised
+
+	Yields:
+		tuple: (name, id, age, grades) for each line of the file
+
+	Raises:
+		ValueError: If the file extension is not supported
+	"""
+	if path.endswith(".csv"):
+		parse = _parse_csv
+	elif path.endswith(".jsonl"):
+		parse = _parse_jsonl
+	else:
+		raise ValueError(f"Unsupported file type: {path}")
+	with open(path, newline="", encoding="utf-8") as file:
+		if parse is _parse_csv:
+			reader = csv.reader(file)
+			raws = (row for row in reader
+				if row and not (reader.line_num == 1 and row[0].strip().lower() == "name"))
+		else:
+			raws = (line for line in file if line.strip())
+		for raw in raws:
+			try:
+				row = parse(raw)
+			except PARSE_ERRORS as error:
+				if on_error is None:
+					raise
+				on_error(raw, error)
+				continue
+			yield row
+
+
+def iter_chunks(iterable, size):
+	"""
+	Group an iterable into lists of at most size items.
+
+	Args:
+		iterable (iterable): Items to group
+		size (int): Maximum number of items per chunk
+
+	Yields:
+		list: The next chunk of items
+	"""
+	iterator = iter(iterable)
+	while True:
+		chunk = list(islice(iterator, size))
+		if not chunk:
+			return
+		yield chunk
+
+
+def load_students(path, roster, chunk_size=10000, on_reject=None):
+	"""
+	Load every valid student of a file into a roster.
+
+	The roster can be a StudentRegistry or a ColumnarGradebook: anything
+	that supports "id in roster" and add_rows(rows).
+
+	Args:
+		path (str): Path to a .csv or .jsonl file
+		roster: The roster that receives the students
+		chunk_size (int): Number of rows validated and inserted together
+		on_reject (callable): Called as on_reject(row, reason) for every
+			rejected row, where reason is "invalid" or "duplicate" (rows that
+			cannot be parsed are passed as read: a CSV list or a JSON line)
+
+	Returns:
+		dict: Number of loaded, invalid and duplicate rows
+	"""
+	report = {"loaded": 0, "invalid": 0, "duplicates": 0}
+
+	def reject_unparsed(raw, error):
+		report["invalid"] += 1
+		if on_reject is not None:
+			on_reject(raw, "invalid")
+
+	for chunk in iter_chunks(read_rows(path, reject_unparsed), chunk_size):
+		accepted = []
+		seen = set()
+		for row in chunk:
+			id = row[1]
+			if not 0 < id <= MAX_ID or not 0 <= row[2] <= MAX_AGE or not VALID_GRADES.issuperset(row[3]):
+				reason = "invalid"
+				report["invalid"] += 1
+			elif id in seen or id in roster:
+				reason = "duplicate"
+				report["duplicates"] += 1
+			else:
+				seen.add(id)
+				accepted.append(row)
+				continue
+			if on_reject is not None:
+				on_reject(row, reason)
+		roster.add_rows(accepted)
+		report["loaded"] += len(accepted)
+	return report
+
+
+def main():
+	"""Load the files given on the command line and print a summary."""
+	registry = StudentRegistry()
+	for path in sys.argv[1:]:
+		start = time.perf_counter()
+		report = load_students(path, registry)
+		elapsed = time.perf_counter() - start
+		print(f"{path}: {report} in {elapsed:.2f}s")
+	print(f"Students: {len(registry)}, approved: {registry.approved_count()}")
+
+if __name__ == "__main__":
+	main()
@@ -1,3 +1,9 @@
+import random
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from operator import add
+
 #Clase con inicializador
 class Persona:
 
@@ -22,6 +28,231 @@ class Persona:
     self.is_alive = False
     print(f"{self.name} ha fallecido")
 
+#Indice ordenado por cubetas: cada clave (edad en años, altura en centimetros)
+#guarda el conjunto de personas con esa clave y las claves se mantienen
+#ordenadas, asi una busqueda por rango solo visita las cubetas del rango
+class BucketIndex:
+
+  def __init__(self):
+    self.buckets = {}
+    self.keys = []
+
+  def add(self, key, index):
+    bucket = self.buckets.get(key)
+    if bucket is None:
+      bucket = self.buckets[key] = set()
+      insort(self.keys, key)
+    bucket.add(index)
+
+  def remove(self, key, index):
+    bucket = self.buckets[key]
+    bucket.discard(index)
+    if not bucket:
+      del self.buckets[key]
+      del self.keys[bisect_left(self.keys, key)]
+
+  def move(self, old_key, new_key, index):
+    if old_key != new_key:
+      self.remove(old_key, index)
+      self.add(new_key, index)
+
+  def range(self, low=None, high=None):
+    #Personas con low <= clave <= high (None = sin limite)
+    start = 0 if low is None else bisect_left(self.keys, low)
+    stop = len(self.keys) if high is None else bisect_right(self.keys, high)
+    found = set()
+    for key in self.keys[start:stop]:
+      found |= self.buckets[key]
+    return found
+
+def height_key(height):
+  return int(height * 100)
+
+#Tabla de personas guardada por columnas: cada atributo vive en un array
+#compacto y el genero se guarda como codigo (indice en gender_options)
+class Poblacion:
+
+  gender_options = Persona.gender_options
+  gender_codes = {gender: code for code, gender in enumerate(gender_options)}
+
+  def __init__(self):
+    self.names = []
+    self.ages = array("H")
+    self.genders = array("B")
+    self.heights = array("d")
+    self.alive = bytearray()
+    #Indices secundarios, actualizados en cada cambio
+    self.age_index = BucketIndex()
+    self.height_index = BucketIndex()
+    self.gender_index = {code: set() for code in range(len(self.gender_options))}
+
+  def __len__(self):
+    return len(self.names)
+
+  def add(self, name, age, gender, height):
+    #Devuelve el indice de la nueva persona
+    self.names.append(name)
+    self.ages.append(age)
+    self.genders.append(self.gender_codes.get(gender, self.gender_codes["Otro"]))
+    self.heights.append(height)
+    self.alive.append(1)
+    index = len(self.names) - 1
+    self.age_index.add(age, index)
+    self.height_index.add(height_key(height), index)
+    self.gender_index[self.genders[index]].add(index)
+    return index
+
+  def add_persona(self, persona):
+    index = self.add(persona.name, persona.age, persona.gender, persona.height)
+    self.alive[index] = persona.is_alive
+    return index
+
+  def gender(self, index):
+    return self.gender_options[self.genders[index]]
+
+  def persona(self, index):
+    #Crea un objeto Persona con los datos de la fila
+    persona = Persona(self.names[index], self.ages[index], self.gender(index), self.heights[index])
+    if not self.alive[index]:
+      persona.is_alive = False
+    return persona
+
+  def birthday(self, index):
+    self.ages[index] += 1
+    self.age_index.move(self.ages[index] - 1, self.ages[index], index)
+    print(f"Feliz cumpleaños {self.names[index]}! Ahora tienes {self.ages[index]} años")
+
+  def grow(self, index, height):
+    old_key = height_key(self.heights[index])
+    self.heights[index] += height
+    self.height_index.move(old_key, height_key(self.heights[index]), index)
+    print(f"Ahora mides {self.heights[index]} metros")
+
+  def die(self, index):
+    self.alive[index] = 0
+    print(f"{self.names[index]} ha fallecido")
+
+  #Operaciones sobre toda la poblacion: una sola pasada por columna y, en vez
+  #de un print por persona, un resumen opcional. Las mascaras son bytes con
+  #un 1 por persona seleccionada y un 0 por persona no seleccionada
+  def birthday_all(self, mask=None, summary=False):
+    #Sin mascara cumplen años todas las personas vivas
+    mask = self.alive if mask is None else self._check_length(mask)
+    self.ages = array("H", [age + 1 if selected else age for age, selected in zip(self.ages, mask)])
+    self._index_ages()
+    aged = mask.count(1)
+    if summary:
+      print(f"{aged} personas cumplieron años")
+    return aged
+
+  def grow_all(self, deltas, summary=False):
+    #deltas tiene un crecimiento (en metros) por persona
+    self.heights = array("d", map(add, self.heights, self._check_length(deltas)))
+    self._index_heights()
+    if summary:
+      print(f"{len(self)} personas crecieron en total {sum(deltas):.2f} metros")
+
+  def die_all(self, deaths, summary=False):
+    #deaths marca con un 1 a las personas que fallecen
+    self._check_length(deaths)
+    before = self.alive.count(1)
+    alive = int.from_bytes(self.alive, "big") & ~int.from_bytes(deaths, "big")
+    self.alive = bytearray(alive.to_bytes(len(self.alive), "big"))
+    died = before - self.alive.count(1)
+    if summary:
+      print(f"{died} personas fallecieron")
+    return died
+
+  #Despues de una operacion sobre toda la poblacion es mas rapido
+  #reconstruir el indice que mover a cada persona de cubeta
+  def _index_ages(self):
+    self.age_index = BucketIndex()
+    for index, age in enumerate(self.ages):
+      self.age_index.add(age, index)
+
+  def _index_heights(self):
+    self.height_index = BucketIndex()
+    for index, height in enumerate(self.heights):
+      self.height_index.add(height_key(height), index)
+
+  #Busca personas combinando los indices; los limites son inclusivos y
+  #devuelve los indices ordenados
+  def query(self, gender=None, min_age=None, max_age=None, min_height=None, max_height=None, alive=True):
+    candidates = []
+    if gender is not None:
+      candidates.append(self.gender_index[self.gender_codes.get(gender, self.gender_codes["Otro"])])
+    if min_age is not None or max_age is not None:
+      candidates.append(self.age_index.range(min_age, max_age))
+    if min_height is not None or max_height is not None:
+      candidates.append(self.height_index.range(
+        None if min_height is None else height_key(min_height),
+        None if max_height is None else height_key(max_height)))
+    if candidates:
+      candidates.sort(key=len)
+      found = candidates[0].intersection(*candidates[1:])
+    else:
+      found = range(len(self))
+    heights = self.heights
+    return sorted(index for index in found
+      if (not alive or self.alive[index])
+      and (min_height is None or heights[index] >= min_height)
+      and (max_height is None or heights[index] <= max_height))
+
+  def _check_length(self, values):
+    if len(values) != len(self):
+      raise ValueError(f"Se esperaban {len(self)} valores y hay {len(values)}")
+    return values
+
+  def describe(self, index):
+    return f"Nombre: {self.names[index]}, Edad: {self.ages[index]}, Genero: {self.gender(index)}, Altura: {self.heights[index]}"
+
+#Mide la memoria de n personas como objetos Persona y como Poblacion
+def memory_report(n=100000):
+  tracemalloc.start()
+  personas = [Persona(f"Persona {i}", i % 100, Persona.gender_options[i % 3], 1.5 + i % 50 / 100) for i in range(n)]
+  for persona in personas[::2]:
+    persona.is_alive = False
+  objects_size = tracemalloc.get_traced_memory()[0]
+  del personas
+  tracemalloc.stop()
+
+  tracemalloc.start()
+  poblacion = Poblacion()
+  for i in range(n):
+    poblacion.add(f"Persona {i}", i % 100, Persona.gender_options[i % 3], 1.5 + i % 50 / 100)
+  for i in range(0, n, 2):
+    poblacion.alive[i] = 0
+  table_size = tracemalloc.get_traced_memory()[0]
+  del poblacion
+  tracemalloc.stop()
+
+  print(f"Persona: {objects_size / n:.0f} bytes por persona")
+  print(f"Poblacion: {table_size / n:.0f} bytes por persona")
+  print(f"Reduccion: {1 - table_size / objects_size:.0%}")
+
+#Genera filas (nombre, edad, genero, altura) reproducibles para pruebas de
+#carga, una por vez para no ocupar memoria. La altura sigue una normal y el
+#genero se elige con los pesos indicados
+nombres = ["Lucas", "Sofia", "Mateo", "Valentina", "Martin", "Camila", "Juan", "Lucia"]
+
+def generate_person_rows(n, seed=None, ages=(0, 100), height_mean=1.70, height_sd=0.10, gender_weights=(0.49, 0.49, 0.02)):
+  rng = random.Random(seed)
+  min_age, max_age = ages
+  for _ in range(n):
+    gender = rng.choices(Persona.gender_options, gender_weights)[0]
+    height = round(max(0.4, rng.gauss(height_mean, height_sd)), 2)
+    yield rng.choice(nombres), rng.randint(min_age, max_age), gender, height
+
+def generate_personas(n, seed=None, **distribution):
+  for row in generate_person_rows(n, seed, **distribution):
+    yield Persona(*row)
+
+def generate_poblacion(n, seed=None, **distribution):
+  poblacion = Poblacion()
+  for row in generate_person_rows(n, seed, **distribution):
+    poblacion.add(*row)
+  return poblacion
+
 # persona1 = Persona("Lucas", 17, "Masculino", 1.95)
 
 # print("Nombre de la persona 2: ",persona1.name, 
@@ -37,26 +268,47 @@ class Persona:
 # persona1.die()
 # print(persona1.is_alive)
 
-personas = []
+# memory_report()
 
-while True:
-  print("1. Agregar persona")
-  print("2. Ver personas")
-  print("3. Salir")
-  opcion = int(input("Ingrese una opción: "))
+def main():
+  personas = Poblacion()
 
-  if opcion == 1:
-    nombre = input("Ingrese el nombre de la persona: ")
-    edad = int(input("Ingrese la edad de la persona: "))
-    genero = input("Ingrese el genero de la persona: ")
-    altura = float(input("Ingrese la altura de la persona: "))
+  while True:
+    print("1. Agregar persona")
+    print("2. Ver personas")
+    print("3. Buscar personas")
+    print("4. Salir")
+    opcion = int(input("Ingrese una opción: "))
 
-    persona = Persona(nombre, edad, genero, altura)
-    personas.append(persona)
-  
-  if opcion == 2:
-    for persona in personas:
-      print(f"Nombre: {persona.name}, Edad: {persona.age}, Genero: {persona.gender}, Altura: {persona.height}")
+    if opcion == 1:
+      nombre = input("Ingrese el nombre de la persona: ")
+      edad = int(input("Ingrese la edad de la persona: "))
+      genero = input("Ingrese el genero de la persona: ")
+      altura = float(input("Ingrese la altura de la persona: "))
+
+      personas.add(nombre, edad, genero, altura)
+
+    if opcion == 2:
+      for index in range(len(personas)):
+        print(personas.describe(index))
+
+    if opcion == 3:
+      genero = input("Genero (vacio para todos): ") or None
+      edad_minima = input("Edad minima (vacio para no filtrar): ")
+      edad_maxima = input("Edad maxima (vacio para no filtrar): ")
+      altura_minima = input("Altura minima (vacio para no filtrar): ")
+      altura_maxima = input("Altura maxima (vacio para no filtrar): ")
+      encontradas = personas.query(
+        genero,
+        int(edad_minima) if edad_minima else None,
+        int(edad_maxima) if edad_maxima else None,
+        float(altura_minima) if altura_minima else None,
+        float(altura_maxima) if altura_maxima else None)
+      for index in encontradas:
+        print(personas.describe(index))
+
+    if opcion == 4:
+      break
 
-  if opcion == 3:
-    break
\ No newline at end of file
+if __name__ == "__main__":
+  main()
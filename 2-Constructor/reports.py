@@ -0,0 +1,109 @@
+"""
+Student Report Documentation
+
+Overview:
+This module renders student listings page by page. Each page is built as one
+string and handed to the output with a single write() call, instead of one
+print() per student, so large rosters can be sent to a terminal, a file, a
+pipe or an in-memory buffer efficiently.
+
+Any object with an info() method returning one formatted line works as a
+student (Student, StudentView, MappedStudent).
+
+Functions:
+- select_students: Filters students (approved only, ID range)
+- iter_pages: Generator of rendered pages
+- write_report: Writes every page, or a single page, to an output stream
+
+Students before the requested page are skipped without being formatted, so
+writing one page only calls info() for the students on that page.
+
+Usage Example:
+write_report(registry, sys.stdout)                        # Whole roster
+write_report(registry, file, page_size=100, page=2)       # Third page only
+write_report(registry, buffer, approved_only=True, id_range=(1, 500))
+"""
+
+from itertools import islice
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def select_students(students, approved_only=False, id_range=None):
+	"""
+	Filter students for a report.
+
+	Args:
+		students (iterable): Students to filter
+		approved_only (bool): Keep only approved students
+		id_range (tuple): Inclusive (lowest, highest) ID to keep, or None
+
+	Yields:
+		The students that pass every filter, in their original order
+	"""
+	for student in students:
+		if id_range is not None and not id_range[0] <= student.id <= id_range[1]:
+			continue
+		if approved_only and not student.is_approved():
+			continue
+		yield student
+
+
+def iter_pages(students, page_size=DEFAULT_PAGE_SIZE, approved_only=False, id_range=None, start_page=0):
+	"""
+	Render the selected students as pages of text.
+
+	Args:
+		students (iterable): Students to render
+		page_size (int): Maximum number of students per page
+		approved_only (bool): Keep only approved students
+		id_range (tuple): Inclusive (lowest, highest) ID to keep, or None
+		start_page (int): Index of the first page to render; the students
+			of earlier pages are skipped without being formatted
+
+	Yields:
+		str: One page, with a line per student
+
+	Raises:
+		ValueError: If page_size is not positive or start_page is negative
+	"""
+	if page_size <= 0:
+		raise ValueError("Page size must be positive")
+	if start_page < 0:
+		raise ValueError("Page index cannot be negative")
+	selected = islice(select_students(students, approved_only, id_range), start_page * page_size, None)
+	while True:
+		lines = [student.info() for student in islice(selected, page_size)]
+		if not lines:
+			return
+		lines.append("")
+		yield "\n".join(lines)
+
+
+def write_report(students, out, page_size=DEFAULT_PAGE_SIZE, page=None, approved_only=False, id_range=None):
+	"""
+	Write a student report to an output stream, one write() call per page.
+
+	Args:
+		students (iterable): Students to render
+		out: Writable text stream (sys.stdout, an open file, io.StringIO...)
+		page_size (int): Maximum number of students per page
+		page (int): Index of the only page to write (starting at 0), or None
+			to write every page
+		approved_only (bool): Keep only approved students
+		id_range (tuple): Inclusive (lowest, highest) ID to keep, or None
+
+	Returns:
+		int: Number of pages written
+
+	Raises:
+		ValueError: If page_size is not positive or page is negative
+	"""
+	pages = iter_pages(students, page_size, approved_only, id_range, page or 0)
+	if page is not None:
+		pages = islice(pages, 1)
+	written = 0
+	for text in pages:
+		out.write(text)
+		written += 1
+	return written
@@ -0,0 +1,196 @@
+"""
+Sharded Gradebook Aggregation Documentation
+
+Overview:
+This module computes term statistics of a roster with several processes.
+The roster is split into shards by student ID, every worker process computes
+partial statistics for its shard, and the partial results are merged. All
+partial values are integers, so the merged result is exact and identical to
+the one computed serially with Student.average() and Student.is_approved().
+
+Statistics (a dict):
+- students: Number of students
+- grades: Number of grades
+- grade_sum: Sum of every grade
+- histogram: Number of times each grade 0-10 was given
+- approved: Number of approved students
+- mean: grade_sum / grades (0.0 if there are no grades)
+
+Functions:
+- aggregate_students: Shards Student-like objects by ID (id % shards)
+- aggregate_file: Shards a GradebookFile (see storage.py) by record range;
+  records are sorted by ID, so each worker maps the file and reads a
+  contiguous ID range without anything being copied to it
+- serial_stats: Reference result computed with the Student methods
+- merge_stats: Merges partial statistics
+
+Usage Example:
+stats = aggregate_students(registry, processes=8)
+stats = aggregate_file("students.grdb", processes=8)
+assert stats == serial_stats(registry)
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from grades import Student
+from storage import HEADER, RECORD
+
+GRADE_RANGE = len(Student.grades_options)
+
+
+def empty_stats():
+	"""
+	Create statistics for an empty roster.
+
+	Returns:
+		dict: Statistics with every counter at zero
+	"""
+	return {"students": 0, "grades": 0, "grade_sum": 0, "histogram": [0] * GRADE_RANGE, "approved": 0}
+
+
+def merge_stats(partials):
+	"""
+	Merge partial statistics into the statistics of the whole roster.
+
+	Args:
+		partials (iterable): Statistics returned by the workers
+
+	Returns:
+		dict: The merged statistics, including the overall mean grade
+	"""
+	total = empty_stats()
+	for partial in partials:
+		for key in ("students", "grades", "grade_sum", "approved"):
+			total[key] += partial[key]
+		total["histogram"] = [a + b for a, b in zip(total["histogram"], partial["histogram"])]
+	total["mean"] = total["grade_sum"] / total["grades"] if total["grades"] else 0.0
+	return total
+
+
+def _shard_stats(records):
+	"""
+	Compute the statistics of one shard.
+
+	Args:
+		records (list): (id, grades) pairs, grades being a bytes object
+
+	Returns:
+		dict: Partial statistics of the shard
+	"""
+	stats = empty_stats()
+	every_grade = bytearray()
+	approved = 0
+	for _, grades in records:
+		count = len(grades)
+		if count and sum(grades) >= 6 * count:
+			approved += 1
+		every_grade += grades
+	stats["students"] = len(records)
+	stats["grades"] = len(every_grade)
+	stats["grade_sum"] = sum(every_grade)
+	stats["histogram"] = [every_grade.count(grade) for grade in range(GRADE_RANGE)]
+	stats["approved"] = approved
+	return stats
+
+
+def _file_range_stats(path, start, stop):
+	"""
+	Compute the statistics of the records start to stop of a gradebook file.
+
+	Args:
+		path (str): Path of the gradebook file
+		start (int): First record of the range
+		stop (int): Record after the last one of the range
+
+	Returns:
+		dict: Partial statistics of the range
+	"""
+	with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+		grade_capacity = HEADER.unpack_from(data, 0)[2]
+		record_size = RECORD.size + grade_capacity
+		records = []
+		for offset in range(HEADER.size + start * record_size, HEADER.size + stop * record_size, record_size):
+			id, _, count = struct.unpack_from("<qHH", data, offset)
+			records.append((id, data[offset + RECORD.size:offset + RECORD.size + count]))
+		return _shard_stats(records)
+
+
+def serial_stats(students):
+	"""
+	Compute the statistics in this process with the Student methods.
+
+	Args:
+		students (iterable): Student-like objects
+
+	Returns:
+		dict: The statistics of the roster
+	"""
+	stats = empty_stats()
+	for student in students:
+		grades = student.grades
+		stats["students"] += 1
+		stats["grades"] += len(grades)
+		stats["grade_sum"] += sum(grades)
+		for grade in grades:
+			stats["histogram"][grade] += 1
+		if student.is_approved():
+			stats["approved"] += 1
+	return merge_stats([stats])
+
+
+def aggregate_students(students, processes=None, shards=None):
+	"""
+	Compute the statistics with a process pool, sharding students by ID.
+
+	Args:
+		students (iterable): Student-like objects
+		processes (int): Number of worker processes (defaults to the CPU count)
+		shards (int): Number of shards (defaults to the number of processes)
+
+	Returns:
+		dict: The statistics of the roster
+	"""
+	processes = processes or os.cpu_count() or 1
+	shards = shards or processes
+	partitions = [[] for _ in range(shards)]
+	for student in students:
+		partitions[student.id % shards].append((student.id, bytes(student.grades)))
+	with ProcessPoolExecutor(processes) as pool:
+		return merge_stats(pool.map(_shard_stats, partitions))
+
+
+def aggregate_file(path, processes=None, shards=None):
+	"""
+	Compute the statistics of a gradebook file with a process pool.
+
+	Args:
+		path (str): Path of a file written by storage.GradebookFile.write
+		processes (int): Number of worker processes (defaults to the CPU count)
+		shards (int): Number of shards (defaults to the number of processes)
+
+	Returns:
+		dict: The statistics of the roster
+	"""
+	processes = processes or os.cpu_count() or 1
+	shards = shards or processes
+	with open(path, "rb") as file:
+		count = HEADER.unpack(file.read(HEADER.size))[3]
+	bounds = [count * shard // shards for shard in range(shards + 1)]
+	with ProcessPoolExecutor(processes) as pool:
+		return merge_stats(pool.map(_file_range_stats, [path] * shards, bounds[:-1], bounds[1:]))
+
+
+def main():
+	"""Aggregate the gradebook files given on the command line."""
+	for path in sys.argv[1:]:
+		start = time.perf_counter()
+		stats = aggregate_file(path)
+		print(f"{path}: {stats} in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,320 @@
+"""
+Binary Gradebook File Documentation
+
+Overview:
+This module saves students to a compact binary file and opens it again with
+mmap, so a saved roster is available immediately: opening the file reads only
+its header, and each lookup only touches the pages of the records it reads.
+
+File Layout (little endian):
+- Header: magic b"GRDB", version, grade capacity, record count, string table offset
+- Records: one fixed-width record per student, sorted by ID
+  - id (int64), age (uint16), grade count (uint16)
+  - name offset and name length in the string table (uint32, uint16)
+  - grade slots (grade capacity x uint8)
+- String table: the UTF-8 encoded names, back to back
+
+Every record reserves grade_capacity slots, so add_note writes the new grade
+and the new count in place without rewriting the file.
+
+write() validates every student first and replaces the file atomically, so a
+failed save never leaves a partial file. Opening a file checks that its size
+matches the header, so a truncated file is rejected immediately.
+
+Classes:
+- GradebookFile: Creates, opens and searches a gradebook file
+- MappedStudent: A Student-like view of one record of an open file
+
+Usage Example:
+GradebookFile.write("students.grdb", [Student("Juan", 1, 20, [10, 7, 6])])
+with GradebookFile("students.grdb") as book:
+	student = book.find(1)
+	student.add_note(9)  # Written straight into the file
+	student.see_info()
+"""
+
+import mmap
+import os
+import struct
+
+from grades import Student, StudentRegistry
+
+MAGIC = b"GRDB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQ")
+RECORD = struct.Struct("<qHHIH")
+GRADE_COUNT_OFFSET = 10
+DEFAULT_GRADE_CAPACITY = 32
+
+
+class MappedStudent:
+	"""
+	A Student-like view of one record of an open GradebookFile.
+
+	Attributes:
+		book (GradebookFile): The open file holding the record
+		index (int): Position of the record in the file
+	"""
+
+	__slots__ = ("book", "index")
+
+	def __init__(self, book, index):
+		"""
+		Initialize a new MappedStudent instance.
+
+		Args:
+			book (GradebookFile): The open file holding the record
+			index (int): Position of the record in the file
+		"""
+		self.book = book
+		self.index = index
+
+	def _fields(self):
+		"""Read the fixed fields (id, age, grade count, name offset, name length)."""
+		return RECORD.unpack_from(self.book.map, self.book.record_offset(self.index))
+
+	@property
+	def name(self):
+		"""Get the student's name from the string table."""
+		name_offset, name_length = self._fields()[3:]
+		start = self.book.strings_offset + name_offset
+		return self.book.map[start:start + name_length].decode("utf-8")
+
+	@property
+	def id(self):
+		"""Get the student's ID."""
+		return self._fields()[0]
+
+	@property
+	def age(self):
+		"""Get the student's age."""
+		return self._fields()[1]
+
+	@property
+	def grades(self):
+		"""Get the student's grades as a list."""
+		start = self.book.record_offset(self.index) + RECORD.size
+		return list(self.book.map[start:start + self._fields()[2]])
+
+	def average(self):
+		"""
+		Calculate the arithmetic mean of all grades.
+
+		Returns:
+			float: The average grade, or 0.0 if the student has no grades
+		"""
+		grades = self.grades
+		if not grades:
+			return 0.0
+		return sum(grades) / len(grades)
+
+	def is_approved(self):
+		"""
+		Check if student passes based on grade threshold.
+
+		Returns:
+			bool: True if average >= 6.0, False otherwise
+		"""
+		return self.average() >= 6.0
+
+	def add_note(self, grade):
+		"""
+		Write a valid grade into the next free slot of the record.
+
+		Args:
+			grade (int): Grade to add (must be 0-10)
+
+		Raises:
+			ValueError: If every grade slot of the record is already used
+		"""
+		if grade in Student.grades_options:
+			offset = self.book.record_offset(self.index)
+			count = self._fields()[2]
+			if count >= self.book.grade_capacity:
+				raise ValueError(f"Student {self.id} already has {count} grades")
+			self.book.map[offset + RECORD.size + count] = grade
+			struct.pack_into("<H", self.book.map, offset + GRADE_COUNT_OFFSET, count + 1)
+
+	def info(self):
+		"""
+		Format the student information as a single line.
+
+		Returns:
+			str: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
+		"""
+		return f"Name: {self.name}, ID: {self.id}, Age: {self.age}, Grades: {self.grades}, Average: {self.average()}"
+
+	def see_info(self):
+		"""
+		Print formatted student information.
+
+		Output format: "Name: {name}, ID: {id}, Age: {age}, Grades: {grades}, Average: {average}"
+		"""
+		print(self.info())
+
+	def to_student(self):
+		"""
+		Copy the record into a regular Student object.
+
+		Returns:
+			Student: A new Student with the same data
+		"""
+		return Student(self.name, self.id, self.age, self.grades)
+
+
+class GradebookFile:
+	"""
+	A class to read and update a memory-mapped binary gradebook file.
+
+	Attributes:
+		path (str): Path of the file
+		map (mmap): The memory-mapped file contents
+		grade_capacity (int): Number of grade slots in every record
+		count (int): Number of records
+		strings_offset (int): Position of the string table in the file
+		record_size (int): Size in bytes of one record
+	"""
+
+	def __init__(self, path):
+		"""
+		Open an existing gradebook file.
+
+		Args:
+			path (str): Path of the file
+
+		Raises:
+			ValueError: If the file is not a gradebook file of a known version,
+				or its size does not match its header
+		"""
+		self.path = path
+		self.file = open(path, "r+b")
+		if os.fstat(self.file.fileno()).st_size < HEADER.size:
+			self.file.close()
+			raise ValueError(f"{path} is not a gradebook file")
+		self.map = mmap.mmap(self.file.fileno(), 0)
+		magic, version, self.grade_capacity, self.count, self.strings_offset = HEADER.unpack_from(self.map, 0)
+		if magic != MAGIC or version != VERSION:
+			self.close()
+			raise ValueError(f"{path} is not a gradebook file")
+		self.record_size = RECORD.size + self.grade_capacity
+		if len(self.map) != self._expected_size():
+			self.close()
+			raise ValueError(f"{path} is truncated or corrupted")
+
+	def _expected_size(self):
+		"""Compute the file size described by the header and the last record."""
+		if self.strings_offset != HEADER.size + self.count * self.record_size:
+			return -1
+		if self.count == 0 or len(self.map) < self.strings_offset:
+			return self.strings_offset
+		# Names are stored in record order, so the last name ends the string table
+		name_offset, name_length = RECORD.unpack_from(self.map, self.record_offset(self.count - 1))[3:]
+		return self.strings_offset + name_offset + name_length
+
+	@classmethod
+	def write(cls, path, students, grade_capacity=DEFAULT_GRADE_CAPACITY):
+		"""
+		Save students to a new gradebook file, replacing any existing file.
+
+		Every student is checked before anything is written, and the file is
+		written to a temporary file first and then moved over path.
+
+		Args:
+			path (str): Path of the file
+			students (iterable): Student-like objects to save
+			grade_capacity (int): Number of grade slots reserved per student
+
+		Raises:
+			ValueError: If a student has more grades than grade_capacity
+		"""
+		students = sorted(students, key=lambda student: student.id)
+		record_size = RECORD.size + grade_capacity
+		strings_offset = HEADER.size + len(students) * record_size
+		records = bytearray()
+		strings = bytearray()
+		try:
+			for student in students:
+				grades = student.grades
+				if len(grades) > grade_capacity:
+					raise ValueError(f"Student {student.id} has more than {grade_capacity} grades")
+				name = student.name.encode("utf-8")
+				records += RECORD.pack(student.id, student.age, len(grades), len(strings), len(name))
+				records += bytes(grades).ljust(grade_capacity, b"\0")
+				strings += name
+		except struct.error as error:
+			raise ValueError(f"Student {student.id} cannot be saved: {error}") from error
+		temporary = f"{path}.tmp"
+		with open(temporary, "wb") as file:
+			file.write(HEADER.pack(MAGIC, VERSION, grade_capacity, len(students), strings_offset))
+			file.write(records)
+			file.write(strings)
+		os.replace(temporary, path)
+
+	def close(self):
+		"""Flush pending writes and close the file."""
+		self.map.close()
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+	def __len__(self):
+		"""Return the number of records."""
+		return self.count
+
+	def __getitem__(self, index):
+		"""Get a view of the record at a position."""
+		if not 0 <= index < self.count:
+			raise IndexError(index)
+		return MappedStudent(self, index)
+
+	def __iter__(self):
+		"""Iterate over a view of every record, in ID order."""
+		for index in range(self.count):
+			yield MappedStudent(self, index)
+
+	def record_offset(self, index):
+		"""
+		Get the position of a record in the file.
+
+		Args:
+			index (int): Position of the record
+
+		Returns:
+			int: Byte offset of the record
+		"""
+		return HEADER.size + index * self.record_size
+
+	def find(self, id):
+		"""
+		Find a student by ID with a binary search over the sorted records.
+
+		Args:
+			id (int): ID of the student
+
+		Returns:
+			MappedStudent: The record view, or None if no student has that ID
+		"""
+		low, high = 0, self.count
+		while low < high:
+			middle = (low + high) // 2
+			middle_id = struct.unpack_from("<q", self.map, self.record_offset(middle))[0]
+			if middle_id < id:
+				low = middle + 1
+			elif middle_id > id:
+				high = middle
+			else:
+				return MappedStudent(self, middle)
+		return None
+
+	def to_registry(self):
+		"""
+		Copy every record into a StudentRegistry.
+
+		Returns:
+			StudentRegistry: A registry with a Student for every record
+		"""
+		return StudentRegistry(record.to_student() for record in self)
@@ -0,0 +1,294 @@
+"""
+Validated Fields Documentation
+
+Overview:
+This module provides a reusable way to encapsulate validated attributes.
+Instead of writing a property and a setter with an if/else for every
+attribute, a class declares a ValidatedField with a list of constraints.
+The constraints are compiled once, when the class is created, into a single
+validation function, and invalid values raise a ValueError instead of being
+printed and silently ignored.
+
+Constraints:
+- Positive: The value must be greater than zero
+- NonNegative: The value must be zero or greater
+- Between(low, high): The value must be between low and high (inclusive)
+- Clamped(low, high): Values outside [low, high] are moved to the nearest bound
+- OneOf(options): The value must be one of the options
+
+Bounds of Between and Clamped can be numbers or functions that receive the
+object being validated (for example lambda character: character.get_max_health()).
+
+Descriptor:
+- ValidatedField: Validates on assignment and stores the value in a private attribute
+
+Batch API:
+- batch_assign: Validates a whole list of values for a list of objects, assigns
+  the valid ones and returns every violation at once
+
+Usage Example:
+class Person:
+    Age = ValidatedField(Positive(), attr="_Person__age")
+
+person.Age = 21    # Valid age
+person.Age = -5    # Raises ValueError("Age must be positive")
+violations = batch_assign(people, "Age", [20, -1, 30])  # [Violation(1, -1, "Age must be positive")]
+"""
+
+from collections import namedtuple
+
+Violation = namedtuple("Violation", ["index", "value", "message"])
+
+
+class ValidationError(ValueError):
+    """
+    Error raised by batch_assign in strict mode.
+
+    Attributes:
+        violations (list): Every Violation found in the batch
+    """
+
+    def __init__(self, violations):
+        """
+        Initialize a new ValidationError instance.
+
+        Args:
+            violations (list): Every Violation found in the batch
+        """
+        super().__init__(f"{len(violations)} invalid values, first: {violations[0].message}")
+        self.violations = violations
+
+
+def _bound(bound):
+    """Turn a bound into a function of the validated object."""
+    if callable(bound):
+        return bound
+    return lambda owner: bound
+
+
+class Positive:
+    """A constraint that only accepts values greater than zero."""
+
+    def compile(self, label):
+        """Build the check function (owner, value) -> value."""
+        message = f"{label} must be positive"
+        def check(owner, value):
+            if value > 0:
+                return value
+            raise ValueError(message)
+        return check
+
+
+class NonNegative:
+    """A constraint that only accepts values of zero or greater."""
+
+    def compile(self, label):
+        """Build the check function (owner, value) -> value."""
+        message = f"{label} cannot be negative"
+        def check(owner, value):
+            if value >= 0:
+                return value
+            raise ValueError(message)
+        return check
+
+
+class Between:
+    """
+    A constraint that only accepts values between two inclusive bounds.
+
+    Attributes:
+        low: Lowest accepted value, or a function of the object
+        high: Highest accepted value, or a function of the object
+    """
+
+    def __init__(self, low, high):
+        """
+        Initialize a new Between constraint.
+
+        Args:
+            low: Lowest accepted value, or a function of the object
+            high: Highest accepted value, or a function of the object
+        """
+        self.low = low
+        self.high = high
+
+    def compile(self, label):
+        """Build the check function (owner, value) -> value."""
+        low, high = _bound(self.low), _bound(self.high)
+        def check(owner, value):
+            if low(owner) <= value <= high(owner):
+                return value
+            raise ValueError(f"{label} must be between {low(owner)} and {high(owner)}")
+        return check
+
+
+class Clamped:
+    """
+    A constraint that moves values outside a range to the nearest bound.
+
+    Attributes:
+        low: Lowest value, a function of the object, or None for no bound
+        high: Highest value, a function of the object, or None for no bound
+    """
+
+    def __init__(self, low=None, high=None):
+        """
+        Initialize a new Clamped constraint.
+
+        Args:
+            low: Lowest value, a function of the object, or None for no bound
+            high: Highest value, a function of the object, or None for no bound
+        """
+        self.low = low
+        self.high = high
+
+    def compile(self, label):
+        """Build the check function (owner, value) -> value."""
+        low = None if self.low is None else _bound(self.low)
+        high = None if self.high is None else _bound(self.high)
+        def check(owner, value):
+            if low is not None and value < low(owner):
+                return low(owner)
+            if high is not None and value > high(owner):
+                return high(owner)
+            return value
+        return check
+
+
+class OneOf:
+    """
+    A constraint that only accepts values from a set of options.
+
+    Attributes:
+        options (frozenset): The accepted values
+    """
+
+    def __init__(self, options):
+        """
+        Initialize a new OneOf constraint.
+
+        Args:
+            options (iterable): The accepted values
+        """
+        self.options = frozenset(options)
+
+    def compile(self, label):
+        """Build the check function (owner, value) -> value."""
+        options = self.options
+        message = f"{label} must be one of {sorted(options, key=str)}"
+        def check(owner, value):
+            if value in options:
+                return value
+            raise ValueError(message)
+        return check
+
+
+def compile_validator(constraints, label):
+    """
+    Combine constraints into a single validation function.
+
+    Args:
+        constraints (tuple): The constraints, applied in order
+        label (str): Name of the value used in error messages
+
+    Returns:
+        function: validate(owner, value) returning the (possibly clamped)
+        value or raising ValueError
+    """
+    checks = tuple(constraint.compile(label) for constraint in constraints)
+    if not checks:
+        return lambda owner, value: value
+    if len(checks) == 1:
+        return checks[0]
+    def validate(owner, value):
+        for check in checks:
+            value = check(owner, value)
+        return value
+    return validate
+
+
+class ValidatedField:
+    """
+    A descriptor for an attribute that is validated on every assignment.
+
+    Attributes:
+        constraints (tuple): The constraints of the field
+        attr (str): Name of the attribute holding the value on each object
+        label (str): Name of the value used in error messages
+        validate (function): The compiled validation function
+    """
+
+    def __init__(self, *constraints, attr=None, label=None):
+        """
+        Initialize a new ValidatedField instance.
+
+        Args:
+            *constraints: The constraints, applied in order
+            attr (str): Attribute holding the value (defaults to "_" + field name)
+            label (str): Name used in error messages (defaults to the field name)
+        """
+        self.constraints = constraints
+        self.attr = attr
+        self.label = label
+        self.validate = None
+
+    def __set_name__(self, owner, name):
+        """Compile the validator once the field name is known."""
+        self.name = name
+        if self.attr is None:
+            self.attr = "_" + name
+        if self.label is None:
+            self.label = name[0].upper() + name[1:]
+        self.validate = compile_validator(self.constraints, self.label)
+
+    def __get__(self, obj, objtype=None):
+        """Return the stored value (or the field itself when read from the class)."""
+        if obj is None:
+            return self
+        return obj.__dict__[self.attr]
+
+    def __set__(self, obj, value):
+        """Validate the value and store it."""
+        obj.__dict__[self.attr] = self.validate(obj, value)
+
+
+def batch_assign(objects, field, values, strict=False):
+    """
+    Validate and assign a field on many objects at once.
+
+    Every value is validated before anything is assigned. Valid values are
+    then stored directly, and the invalid ones are reported together.
+
+    Args:
+        objects (list): Objects whose class declares the ValidatedField
+        field (str): Name of the field
+        values (list): One value per object
+        strict (bool): If True, assign nothing and raise ValidationError when
+            any value is invalid
+
+    Returns:
+        list: A Violation for every invalid value (empty if all were valid)
+
+    Raises:
+        ValueError: If objects and values have different lengths
+        ValidationError: In strict mode, if any value is invalid
+    """
+    if len(objects) != len(values):
+        raise ValueError(f"Expected {len(objects)} values, got {len(values)}")
+    descriptors = {}
+    accepted = []
+    violations = []
+    for index, (obj, value) in enumerate(zip(objects, values)):
+        cls = type(obj)
+        descriptor = descriptors.get(cls)
+        if descriptor is None:
+            descriptor = descriptors[cls] = getattr(cls, field)
+        try:
+            accepted.append((obj, descriptor.attr, descriptor.validate(obj, value)))
+        except ValueError as error:
+            violations.append(Violation(index, value, str(error)))
+    if strict and violations:
+        raise ValidationError(violations)
+    for obj, attr, value in accepted:
+        obj.__dict__[attr] = value
+    return violations
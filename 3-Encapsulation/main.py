@@ -11,27 +11,29 @@ Class Attributes:
 
 Methods:
 - __init__: Constructor - Initializes a new person
-- Age (property): Getter - Returns the person's age
-- Age (setter): Setter - Validates and sets the person's age
+- Age (validated field): Returns the person's age and validates new values
 
 Encapsulation Features:
 - Private age attribute (__age) prevents direct external access
-- Property decorator provides controlled access to age
-- Age validation ensures only positive values are accepted
+- A ValidatedField (see fields.py) provides controlled access to age
+- Age validation ensures only positive values are accepted; invalid values raise ValueError
 
 Usage Example:
 person = Person("John", 20, "Male")
 print(person.Age)  # 20
 person.Age = 21    # Valid age
-person.Age = -5    # Invalid age - prints error message
+person.Age = -5    # Invalid age - raises ValueError("Age must be positive")
+batch_assign([person], "Age", [-5])  # Reports [Violation(0, -5, "Age must be positive")]
 """
 
+from fields import Positive, ValidatedField
+
 class Person:
     """
     A class to represent a person with encapsulated age management.
     
     This class demonstrates encapsulation by using private attributes
-    and property decorators to control access to sensitive data.
+    and a validated field descriptor to control access to sensitive data.
     
     Attributes:
         name (str): Person's name (public)
@@ -52,31 +54,9 @@ class Person:
         self.__age = att_age
         self.gender = att_gender
 
-    @property # getter
-    def Age(self):
-        """
-        Get the person's age.
-        
-        Returns:
-            int: The person's current age
-        """
-        return self.__age
-
-    @Age.setter # setter
-    def Age(self, age):
-        """
-        Set the person's age with validation.
-        
-        Only positive age values are accepted. Invalid values
-        will trigger an error message without changing the age.
-        
-        Args:
-            age (int): New age value to set
-        """
-        if age > 0:
-            self.__age = age
-        else:
-            print("Age must be positive")
+    # getter and setter: reading Age returns __age, assigning it checks that
+    # the new age is positive and raises ValueError without changing it otherwise
+    Age = ValidatedField(Positive(), attr="_Person__age")
   
 p1 = Person("John", 20, "Male")
 # print(p1.__age)  # This should return an error
@@ -13,6 +13,17 @@ Book:
 
 Library:
 - books: List of books in the library (list of Book objects)
+- positions: Position of each book in the books list
+- by_author / by_title: Hash indexes from normalized author / title to book positions
+- title_keys: Sorted (normalized title, position) pairs for prefix searches
+- text_index: Inverted index over titles and authors (see text_index.py)
+
+WeakLibrary (Library that does not keep its books alive):
+- books: Weak references to the books (None at the position of a collected book)
+- collected: Number of books removed from the indexes after being collected
+The positions of collected books are released when the keyword index merges
+its segments, and new books reuse them, so a long-running library does not
+grow with every book it has ever held.
 
 Methods:
 Book:
@@ -20,16 +31,39 @@ Book:
 
 Library:
 - __init__: Constructor - Initializes an empty library
-- add_book: Adds a book to the library collection
+- add_book: Adds a book to the library collection and updates the indexes
+- add_books: Adds many books, sorting the prefix index only once
 - see_books: Displays all books in the library
+- position_of: Position of a book in the library
+- find_by_author / find_by_title: Exact lookups (case, accent and spacing insensitive)
+- search_prefix: Books whose title starts with a prefix (autocomplete)
+- search: Ranked keyword search over titles and authors
+- book_at: Book at a position
+
+WeakLibrary:
+- Same methods as Library; collected books disappear from every index
+- compact: Releases the positions of collected books right away
+- stats: Number of live and collected books
 
 Usage Example:
 book1 = Book("The Great Gatsby", "F. Scott Fitzgerald")
 library = Library()
 library.add_book(book1)  # Book exists independently of library
 library.see_books()  # Prints: "The Great Gatsby by F. Scott Fitzgerald"
+library.find_by_author("f. scott fitzgerald")  # [book1]
+library.search_prefix("the gr")  # [book1]
+library.search("gatsby fitzgerald")  # [book1]
+
+weak_library = WeakLibrary()
+weak_library.add_book(Book("1984", "George Orwell"))  # Nothing else references the book
+weak_library.stats()  # {'live': 0, 'collected': 1}
 """
 
+import weakref
+from bisect import bisect_left, insort
+
+from text_index import TextIndex, normalize
+
 class Book:
     """
     A class to represent a book with title and author.
@@ -54,8 +88,16 @@ class Library:
     """
     A class to represent a library that can contain multiple books.
     
+    Books are identified by their position in the books list. Every
+    add_book updates the indexes, so lookups never scan the whole library.
+    
     Attributes:
         books (list): List of Book objects in the library
+        positions (dict): Position of each book, keyed by the Book itself
+        by_author (dict): Book positions keyed by normalized author
+        by_title (dict): Book positions keyed by normalized title
+        title_keys (list): Sorted (normalized title, position) pairs
+        text_index (TextIndex): Keyword index of titles and authors
     """
 
     def __init__(self):
@@ -63,6 +105,11 @@ class Library:
         Initialize a new Library instance with an empty book collection.
         """
         self.books : list[Book] = []
+        self.positions : dict[Book, int] = {}
+        self.by_author : dict[str, list[int]] = {}
+        self.by_title : dict[str, list[int]] = {}
+        self.title_keys : list[tuple[str, int]] = []
+        self.text_index = TextIndex()
 
     def add_book(self, book: Book):
         """
@@ -71,7 +118,38 @@ class Library:
         Args:
             book (Book): The book to add to the library
         """
+        title = self._index_book(book)
+        insort(self.title_keys, (title, self.positions[book]))
+
+    def add_books(self, books):
+        """
+        Add many books to the library collection.
+        
+        The prefix index is sorted once at the end instead of once per book,
+        which is much faster when loading a large catalog.
+        
+        Args:
+            books (iterable): The books to add to the library
+        """
+        for book in books:
+            self.title_keys.append((self._index_book(book), self.positions[book]))
+        self.title_keys.sort()
+
+    def _store(self, book):
+        """Append a book to the collection and return its position."""
+        position = len(self.books)
         self.books.append(book)
+        self.positions[book] = position
+        return position
+
+    def _index_book(self, book):
+        """Append a book and add it to the hash indexes; return its normalized title."""
+        position = self._store(book)
+        title = normalize(book.title)
+        self.by_author.setdefault(normalize(book.author), []).append(position)
+        self.by_title.setdefault(title, []).append(position)
+        self.text_index.add(position, f"{book.title} {book.author}")
+        return title
 
     def see_books(self):
         """
@@ -82,17 +160,233 @@ class Library:
         for book in self.books:
             print(f"{book.title} by {book.author}")
 
-# Create books
-book1 = Book("The Great Gatsby", "F. Scott Fitzgerald")
-book2 = Book("1984", "George Orwell")
-book3 = Book("To Kill a Mockingbird", "Harper Lee")
+    def position_of(self, book):
+        """
+        Get the position of a book in the library.
+        
+        Args:
+            book (Book): A book of the library
+        
+        Returns:
+            int: The book's position in the books list
+        
+        Raises:
+            KeyError: If the book is not in the library
+        """
+        return self.positions[book]
 
-# Create library
-library = Library()
+    def find_by_author(self, author):
+        """
+        Find every book by an author.
+        
+        Args:
+            author (str): Author name (case, accents and spacing are ignored)
+        
+        Returns:
+            list: The author's books, in the order they were added
+        """
+        return [self.book_at(position) for position in self.by_author.get(normalize(author), [])]
+
+    def find_by_title(self, title):
+        """
+        Find every book with a title.
+        
+        Args:
+            title (str): Book title (case, accents and spacing are ignored)
+        
+        Returns:
+            list: The books with that title, in the order they were added
+        """
+        return [self.book_at(position) for position in self.by_title.get(normalize(title), [])]
+
+    def search_prefix(self, prefix, limit=10):
+        """
+        Find books whose title starts with a prefix.
+        
+        Args:
+            prefix (str): Start of the title (case, accents and spacing are ignored)
+            limit (int): Maximum number of books to return
+        
+        Returns:
+            list: Up to limit books, in alphabetical order of title
+        """
+        prefix = normalize(prefix)
+        found = []
+        start = bisect_left(self.title_keys, (prefix,))
+        for title, position in self.title_keys[start:start + limit]:
+            if not title.startswith(prefix):
+                break
+            found.append(self.book_at(position))
+        return found
+
+    def search(self, query, mode="and", limit=10):
+        """
+        Find the books that best match keywords in their title or author.
+        
+        Args:
+            query (str): Keywords to search for
+            mode (str): "and" to require every keyword, "or" for any keyword
+            limit (int): Maximum number of books to return
+        
+        Returns:
+            list: Up to limit books, best match first
+        """
+        return [self.book_at(position) for position, _ in self.text_index.search(query, mode, limit)]
+
+    def book_at(self, position):
+        """
+        Get the book at a position.
+        
+        Args:
+            position (int): Position of the book
+        
+        Returns:
+            Book: The book
+        """
+        return self.books[position]
+
+
+class WeakLibrary(Library):
+    """
+    A library that only holds weak references to its books.
+    
+    Books still exist independently of the library, but the library no
+    longer keeps them alive: when nothing else references a book it is
+    collected and removed from every index automatically.
+    
+    Attributes:
+        books (list): Weak references to the books, by position (None once collected)
+        positions (WeakKeyDictionary): Position of each live book
+        book_keys (dict): Normalized (author, title) of each live book, by position
+        collected (int): Number of books removed after being collected
+    """
+
+    def __init__(self):
+        """
+        Initialize a new WeakLibrary instance with an empty book collection.
+        """
+        super().__init__()
+        self.positions = weakref.WeakKeyDictionary()
+        self.book_keys : dict[int, tuple[str, str]] = {}
+        self.collected = 0
+
+    def _store(self, book):
+        """Store a weak reference to the book at a free position and return the position."""
+        position = self.text_index.next_id()
+        library = weakref.ref(self)
+        def forget(_):
+            owner = library()
+            if owner is not None:
+                owner._forget(position)
+        reference = weakref.ref(book, forget)
+        if position == len(self.books):
+            self.books.append(reference)
+        else:
+            self.books[position] = reference
+        self.positions[book] = position
+        self.book_keys[position] = (normalize(book.author), normalize(book.title))
+        return position
+
+    def add_book(self, book: Book):
+        """
+        Add a book to the library collection.
+        
+        Args:
+            book (Book): The book to add to the library
+        """
+        super().add_book(book)
+        self._trim()
+
+    def add_books(self, books):
+        """
+        Add many books to the library collection.
+        
+        The books are held until the prefix index is sorted, so none of
+        them can be collected while the index is being built.
+        
+        Args:
+            books (iterable): The books to add to the library
+        """
+        books = list(books)
+        super().add_books(books)
+        self._trim()
+
+    def compact(self):
+        """
+        Release the positions of the collected books now.
+        
+        Merges the keyword index, which purges the collected books and frees
+        their positions for the next books added.
+        """
+        self.text_index.merge()
+        self._trim()
+
+    def _trim(self):
+        """Drop the trailing positions that the keyword index released."""
+        del self.books[len(self.text_index.doc_lengths):]
+
+    def _forget(self, position):
+        """Remove a collected book from every index."""
+        self.books[position] = None
+        author, title = self.book_keys.pop(position)
+        for index, key in ((self.by_author, author), (self.by_title, title)):
+            positions = index[key]
+            positions.remove(position)
+            if not positions:
+                del index[key]
+        del self.title_keys[bisect_left(self.title_keys, (title, position))]
+        self.text_index.remove(position)
+        self.collected += 1
+
+    def book_at(self, position):
+        """
+        Get the book at a position.
+        
+        Args:
+            position (int): Position of the book
+        
+        Returns:
+            Book: The book, or None if it was collected
+        """
+        reference = self.books[position]
+        return reference() if reference is not None else None
+
+    def see_books(self):
+        """
+        Display all live books in the library.
+        
+        Output format: Prints each book as "Title by Author" on separate lines
+        """
+        for reference in self.books:
+            book = reference() if reference is not None else None
+            if book is not None:
+                print(f"{book.title} by {book.author}")
+
+    def stats(self):
+        """
+        Count live and collected books.
+        
+        Returns:
+            dict: Number of live books and of books collected so far
+        """
+        return {"live": len(self.book_keys), "collected": self.collected}
+
+def main():
+    """Demonstrate a library aggregating independent books."""
+    # Create books
+    book1 = Book("The Great Gatsby", "F. Scott Fitzgerald")
+    book2 = Book("1984", "George Orwell")
+    book3 = Book("To Kill a Mockingbird", "Harper Lee")
+
+    # Create library
+    library = Library()
+
+    # Add books to library
+    library.add_book(book1)
+    library.add_book(book2)
+    library.add_book(book3)
 
-# Add books to library
-library.add_book(book1)
-library.add_book(book2)
-library.add_book(book3)
+    library.see_books()
 
-library.see_books()
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,17 @@ This module demonstrates the Association relationship between Teacher and Subjec
 Association is a "uses-a" relationship where objects can exist independently but can be linked.
 
 Class Attributes:
+AssociationRegistry:
+- rights / lefts: Dictionaries of ordered sets linking teachers and subjects both ways
+- linked / unlinked: Number of links created and explicitly removed
+
+WeakAssociationRegistry:
+- Same as AssociationRegistry, but only holds weak references, so teachers and
+  subjects that are no longer used elsewhere are collected and their links vanish
+
 Subject:
 - name: Subject's name (string)
-- teacher: List of teachers assigned to this subject
+- teacher: List of teachers assigned to this subject (read from and written to the registry)
 
 Teacher:
 - name: Teacher's name (string)
@@ -16,6 +24,22 @@ Teacher:
 - subject: Currently assigned subject (Subject object)
 
 Methods:
+AssociationRegistry:
+- link / unlink / reassign: Change links in constant time
+- link_many: Links many (teacher, subject) pairs at once
+- rights_of / lefts_of: Subjects of a teacher / teachers of a subject
+- stats: Number of live links and of links that vanished with a collected object
+
+use_registry: Makes every Teacher and Subject use another registry
+
+Default Registry:
+Teacher and Subject share faculty, a WeakAssociationRegistry, so the links
+never keep a teacher or a subject alive: once nothing else uses them they
+are collected and their links disappear. A teacher that is only referenced
+by its subject is therefore collected too; call
+use_registry(AssociationRegistry()) when the links should hold their
+objects alive.
+
 Subject:
 - __init__: Constructor - Initializes a new subject
 - change_name: Updates the subject's name
@@ -23,7 +47,8 @@ Subject:
 
 Teacher:
 - __init__: Constructor - Initializes a new teacher
-- assign_subject: Links teacher to a subject (bidirectional association)
+- assign_subject: Links teacher to a subject (bidirectional association),
+  removing the link to the previously assigned subject
 
 Usage Example:
 subject1 = Subject("Math")
@@ -33,8 +58,236 @@ print(teacher1.subject.name)  # "Math"
 subject1.change_name("Maths")  # Updates subject name
 print(teacher1.subject.name)  # "Maths" (shows shared reference)
 subject1.see_teachers()  # Prints "John"
+subject1.teacher = [teacher1]  # Replaces the subject's teachers
+
+use_registry(AssociationRegistry())  # Links keep teachers and subjects alive
 """
 
+import weakref
+
+class AssociationRegistry:
+    """
+    A class to store a many-to-many association in both directions.
+
+    Each side maps an object to the objects linked to it. The linked objects
+    are stored as the keys of a dictionary, which works as a set that keeps
+    insertion order, so linking, unlinking and membership tests take
+    constant time.
+
+    Attributes:
+        rights (dict): For each left object (a Teacher), its right objects
+        lefts (dict): For each right object (a Subject), its left objects
+        linked (int): Number of links created
+        unlinked (int): Number of links removed with unlink
+    """
+
+    # Type of the dictionaries used for both the maps and the ordered sets
+    mapping = dict
+
+    def __init__(self):
+        """
+        Initialize a new, empty AssociationRegistry instance.
+        """
+        self.rights : dict[object, dict[object, None]] = self.mapping()
+        self.lefts : dict[object, dict[object, None]] = self.mapping()
+        self.linked = 0
+        self.unlinked = 0
+
+    def __len__(self):
+        """Return the number of links."""
+        return sum(len(rights) for rights in self.rights.values())
+
+    def link(self, left, right):
+        """
+        Link two objects.
+
+        Args:
+            left: Left object (a Teacher)
+            right: Right object (a Subject)
+
+        Returns:
+            bool: True if the link is new, False if it already existed
+        """
+        rights = self.rights.get(left)
+        if rights is None:
+            rights = self.rights[left] = self.mapping()
+        elif right in rights:
+            return False
+        rights[right] = None
+        lefts = self.lefts.get(right)
+        if lefts is None:
+            lefts = self.lefts[right] = self.mapping()
+        lefts[left] = None
+        self.linked += 1
+        return True
+
+    def unlink(self, left, right):
+        """
+        Remove the link between two objects.
+
+        Args:
+            left: Left object (a Teacher)
+            right: Right object (a Subject)
+
+        Returns:
+            bool: True if the link existed, False otherwise
+        """
+        rights = self.rights.get(left)
+        if rights is None or right not in rights:
+            return False
+        del rights[right]
+        if not rights:
+            del self.rights[left]
+        lefts = self.lefts[right]
+        del lefts[left]
+        if not lefts:
+            del self.lefts[right]
+        self.unlinked += 1
+        return True
+
+    def unlink_left(self, left):
+        """
+        Remove every link of a left object.
+
+        Args:
+            left: Left object (a Teacher)
+        """
+        for right in list(self.rights.get(left, ())):
+            self.unlink(left, right)
+
+    def unlink_right(self, right):
+        """
+        Remove every link of a right object.
+
+        Args:
+            right: Right object (a Subject)
+        """
+        for left in list(self.lefts.get(right, ())):
+            self.unlink(left, right)
+
+    def reassign(self, left, right):
+        """
+        Link a left object to a single right object, dropping its other links.
+
+        Args:
+            left: Left object (a Teacher)
+            right: Right object (a Subject)
+        """
+        for old_right in list(self.rights.get(left, ())):
+            if old_right is not right:
+                self.unlink(left, old_right)
+        self.link(left, right)
+
+    def link_many(self, pairs):
+        """
+        Link many (left, right) pairs, for example a whole faculty.
+
+        Args:
+            pairs (iterable): (left, right) pairs
+
+        Returns:
+            int: Number of new links
+        """
+        return sum(self.link(left, right) for left, right in pairs)
+
+    def is_linked(self, left, right):
+        """Check whether two objects are linked."""
+        return right in self.rights.get(left, ())
+
+    def rights_of(self, left):
+        """
+        Get the right objects linked to a left object.
+
+        Args:
+            left: Left object (a Teacher)
+
+        Returns:
+            list: The linked right objects, in link order
+        """
+        return list(self.rights.get(left, ()))
+
+    def lefts_of(self, right):
+        """
+        Get the left objects linked to a right object.
+
+        Args:
+            right: Right object (a Subject)
+
+        Returns:
+            list: The linked left objects, in link order
+        """
+        return list(self.lefts.get(right, ()))
+
+    def stats(self):
+        """
+        Count live links and links that vanished with a collected object.
+        
+        Returns:
+            dict: Number of live links and of collected links
+        """
+        live = len(self)
+        return {"live": live, "collected": self.linked - self.unlinked - live}
+
+
+class WeakAssociationRegistry(AssociationRegistry):
+    """
+    An association registry that does not keep linked objects alive.
+
+    Both the maps and the ordered sets are WeakKeyDictionary objects, so
+    when a teacher or a subject is no longer referenced anywhere else it is
+    collected and every link to it disappears from both directions.
+
+    A set left empty by a collected object is removed like unlink does, but
+    in batches: link prunes the empty sets whenever the maps have doubled
+    since the last pass, so they never outnumber the live entries for long.
+    """
+
+    mapping = weakref.WeakKeyDictionary
+
+    def __init__(self):
+        """
+        Initialize a new, empty WeakAssociationRegistry instance.
+        """
+        super().__init__()
+        self.prune_at = 64
+
+    def link(self, left, right):
+        """
+        Link two objects, pruning the sets emptied by collected objects when due.
+
+        Args:
+            left: Left object (a Teacher)
+            right: Right object (a Subject)
+
+        Returns:
+            bool: True if the link is new, False if it already existed
+        """
+        if len(self.rights) + len(self.lefts) >= self.prune_at:
+            self.prune()
+            self.prune_at = max(64, 2 * (len(self.rights) + len(self.lefts)))
+        return super().link(left, right)
+
+    def prune(self):
+        """Remove the sets left empty by collected objects."""
+        for side in (self.rights, self.lefts):
+            for key, linked in list(side.items()):
+                if not linked:
+                    del side[key]
+
+    def stats(self):
+        """
+        Count live links and links that vanished with a collected object.
+        
+        Returns:
+            dict: Number of live links and of collected links
+        """
+        self.prune()
+        return super().stats()
+
+
+# Registry shared by every Teacher and Subject; weak so it never leaks them
+faculty = WeakAssociationRegistry()
+
 class Subject:
     """
     A class to represent a subject that can be taught by multiple teachers.
@@ -42,7 +295,10 @@ class Subject:
     Attributes:
         name (str): Subject's name
         teacher (list): List of teachers assigned to this subject
+        registry (AssociationRegistry): Registry holding the teacher links
     """
+
+    registry = faculty
     
     def __init__(self, name):
         """
@@ -52,7 +308,6 @@ class Subject:
             name (str): Subject's name
         """
         self.name = name
-        self.teacher = []
 
     def change_name(self, name):
         """
@@ -63,13 +318,35 @@ class Subject:
         """
         self.name = name
 
+    @property
+    def teacher(self):
+        """
+        Get the teachers assigned to this subject.
+        
+        Returns:
+            list: The teachers, in assignment order
+        """
+        return self.registry.lefts_of(self)
+
+    @teacher.setter
+    def teacher(self, teachers):
+        """
+        Replace the teachers assigned to this subject.
+        
+        Args:
+            teachers (iterable): The new teachers, in assignment order
+        """
+        self.registry.unlink_right(self)
+        for teacher in teachers:
+            self.registry.link(teacher, self)
+
     def see_teachers(self):
         """
         Print all teachers assigned to this subject.
         
         Output format: Prints each teacher's name on a separate line
         """
-        for teacher in self.teacher:
+        for teacher in self.registry.lefts_of(self):
             print(teacher.name)
 
 
@@ -81,7 +358,10 @@ class Teacher:
         name (str): Teacher's name
         age (int): Teacher's age
         subject (Subject): Currently assigned subject (can be None)
+        registry (AssociationRegistry): Registry holding the subject links
     """
+
+    registry = faculty
     
     def __init__(self, name, age):
         """
@@ -93,35 +373,60 @@ class Teacher:
         """
         self.name = name
         self.age = age
-        self.subject : Subject 
+        self.subject : Subject = None
 
     def assign_subject(self, subject: Subject):
         """
         Assign a subject to the teacher (creates bidirectional association).
         
+        The teacher is removed from the previously assigned subject, so
+        reassigning never leaves stale or duplicate entries.
+        
         Args:
             subject (Subject): The subject to assign to this teacher
         """
         self.subject = subject
-        subject.teacher.append(self)
+        self.registry.reassign(self, subject)
+
+
+
+def use_registry(registry):
+    """
+    Make every Teacher and Subject use a registry.
+    
+    Args:
+        registry (AssociationRegistry): The registry to use from now on
+    """
+    Teacher.registry = registry
+    Subject.registry = registry
+
 
+def main():
+    """Demonstrate the association between teachers and subjects."""
+    # Create subject
+    subject1=Subject("Math")
+    subject2=Subject("Physics")
 
 
-# Create subject
-subject1=Subject("Math")
+    # Create teachers
+    teacher1=Teacher("John", 30)
+    teacher2=Teacher("Jane", 32)
 
+    # Assign subject to teacher
+    teacher1.assign_subject(subject1)
 
-# Create teachers
-teacher1=Teacher("John", 30)
-teacher2=Teacher("Jane", 32)
+    print(teacher1.subject.name)
 
-# Assign subject to teacher
-teacher1.assign_subject(subject1)
+    subject1.change_name("Maths")
 
-print(teacher1.subject.name)
+    print(teacher1.subject.name)
 
-subject1.change_name("Maths")
+    subject1.see_teachers()
 
-print(teacher1.subject.name)
+    # Reassigning a teacher removes them from the previous subject
+    teacher2.assign_subject(subject1)
+    teacher1.assign_subject(subject2)
+    subject1.see_teachers()  # Prints "Jane" only
 
-subject1.see_teachers()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Library Circulation Documentation
+
+Overview:
+This module lends the books of a Library (aggregation.py) to patrons. Books
+still exist independently of the library and of the loans: a Loan only links
+a book, a patron and a due date.
+
+Classes:
+- Loan: A book lent to a patron until a due date
+- LoanDesk: Checks books out and in, and finds overdue loans
+
+Data Structures:
+- loans: The active loan of each book, keyed by book position
+- patron_loans: The active loans of each patron
+- due_heap: A min-heap of (due date, sequence, book position). Returned books
+  leave stale heap entries that are skipped, and the heap is rebuilt when
+  stale entries outnumber active loans. Finding the k loans overdue at a
+  date only visits the heap entries due before that date, instead of every loan.
+
+Snapshots:
+- save writes the active loans to a JSON file (replaced atomically)
+- load rebuilds a LoanDesk for the same library from that file
+
+Usage Example:
+desk = LoanDesk(library)
+desk.checkout(book1, "ana", datetime(2024, 5, 1))
+desk.overdue(datetime(2024, 5, 2))  # [Loan of book1 to ana]
+desk.return_book(book1)
+desk.save("loans.json")
+"""
+
+import heapq
+import json
+import os
+from datetime import datetime
+
+
+class Loan:
+    """
+    A class to represent a book lent to a patron.
+
+    Attributes:
+        book (Book): The lent book
+        position (int): Position of the book in the library
+        patron: Identifier of the patron (for example a name or card number)
+        due (datetime): When the book must be returned
+        sequence (int): Order in which the loan was made
+    """
+
+    __slots__ = ("book", "position", "patron", "due", "sequence")
+
+    def __init__(self, book, position, patron, due, sequence):
+        """
+        Initialize a new Loan instance.
+
+        Args:
+            book (Book): The lent book
+            position (int): Position of the book in the library
+            patron: Identifier of the patron
+            due (datetime): When the book must be returned
+            sequence (int): Order in which the loan was made
+        """
+        self.book = book
+        self.position = position
+        self.patron = patron
+        self.due = due
+        self.sequence = sequence
+
+    def __repr__(self):
+        return f"Loan({self.book.title!r}, {self.patron!r}, due={self.due.isoformat()})"
+
+
+class LoanDesk:
+    """
+    A class to manage the loans of a library.
+
+    Attributes:
+        library (Library): The library whose books are lent
+        loans (dict): Active loan of each book, keyed by book position
+        patron_loans (dict): Active loans of each patron, keyed by book position
+        due_heap (list): Heap of (due, sequence, position) entries
+    """
+
+    def __init__(self, library):
+        """
+        Initialize a new LoanDesk instance with no loans.
+
+        Args:
+            library (Library): The library whose books are lent
+        """
+        self.library = library
+        self.loans : dict[int, Loan] = {}
+        self.patron_loans : dict[object, dict[int, Loan]] = {}
+        self.due_heap : list[tuple[datetime, int, int]] = []
+        self._next_sequence = 0
+
+    def __len__(self):
+        """Return the number of active loans."""
+        return len(self.loans)
+
+    def checkout(self, book, patron, due):
+        """
+        Lend a book to a patron.
+
+        Args:
+            book (Book): A book of the library
+            patron: Identifier of the patron
+            due (datetime): When the book must be returned
+
+        Returns:
+            Loan: The new loan
+
+        Raises:
+            KeyError: If the book is not in the library
+            ValueError: If the book is already on loan
+        """
+        position = self.library.position_of(book)
+        if position in self.loans:
+            raise ValueError(f"{book.title} is already on loan")
+        loan = Loan(book, position, patron, due, self._next_sequence)
+        self._next_sequence += 1
+        self.loans[position] = loan
+        self.patron_loans.setdefault(patron, {})[position] = loan
+        heapq.heappush(self.due_heap, (due, loan.sequence, position))
+        return loan
+
+    def return_book(self, book):
+        """
+        Take a lent book back.
+
+        Args:
+            book (Book): The returned book
+
+        Returns:
+            Loan: The loan that ended
+
+        Raises:
+            KeyError: If the book is not on loan
+        """
+        position = self.library.position_of(book)
+        loan = self.loans.pop(position)
+        patron_loans = self.patron_loans[loan.patron]
+        del patron_loans[position]
+        if not patron_loans:
+            del self.patron_loans[loan.patron]
+        if len(self.due_heap) > 2 * len(self.loans) + 64:
+            self._rebuild_heap()
+        return loan
+
+    def loans_of(self, patron):
+        """
+        Get the active loans of a patron.
+
+        Args:
+            patron: Identifier of the patron
+
+        Returns:
+            list: The patron's loans, in checkout order
+        """
+        return list(self.patron_loans.get(patron, {}).values())
+
+    def _is_active(self, entry):
+        """Check whether a heap entry belongs to an active loan."""
+        loan = self.loans.get(entry[2])
+        return loan is not None and loan.sequence == entry[1]
+
+    def overdue(self, as_of):
+        """
+        Find every loan that was due before a date.
+
+        The heap is walked from the root and a branch is abandoned as soon
+        as its entry is due at or after as_of, so only the overdue part of
+        the heap is visited.
+
+        Args:
+            as_of (datetime): The reference date
+
+        Returns:
+            list: Overdue loans, earliest due date first
+        """
+        found = []
+        pending = [0] if self.due_heap else []
+        while pending:
+            index = pending.pop()
+            entry = self.due_heap[index]
+            if entry[0] >= as_of:
+                continue
+            if self._is_active(entry):
+                found.append(entry)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self.due_heap):
+                    pending.append(child)
+        found.sort()
+        return [self.loans[entry[2]] for entry in found]
+
+    def _rebuild_heap(self):
+        """Rebuild the heap from the active loans only."""
+        self.due_heap = [(loan.due, loan.sequence, position) for position, loan in self.loans.items()]
+        heapq.heapify(self.due_heap)
+
+    def save(self, path):
+        """
+        Save the active loans to a JSON file.
+
+        The snapshot is written to a temporary file first and then moved
+        over path, so an interrupted save never leaves a partial file.
+
+        Args:
+            path (str): Path of the snapshot file
+        """
+        loans = sorted(self.loans.values(), key=lambda loan: loan.sequence)
+        snapshot = {
+            "next_sequence": self._next_sequence,
+            "loans": [[loan.position, loan.patron, loan.due.isoformat(), loan.sequence] for loan in loans],
+        }
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path, library):
+        """
+        Rebuild a LoanDesk from a snapshot file.
+
+        Args:
+            path (str): Path of a file written by save
+            library (Library): The library the snapshot was taken from
+
+        Returns:
+            LoanDesk: A desk with the saved loans
+        """
+        with open(path, encoding="utf-8") as file:
+            snapshot = json.load(file)
+        desk = cls(library)
+        for position, patron, due, sequence in snapshot["loans"]:
+            loan = Loan(library.book_at(position), position, patron, datetime.fromisoformat(due), sequence)
+            desk.loans[position] = loan
+            desk.patron_loans.setdefault(patron, {})[position] = loan
+            desk.due_heap.append((loan.due, sequence, position))
+        heapq.heapify(desk.due_heap)
+        desk._next_sequence = snapshot["next_sequence"]
+        return desk
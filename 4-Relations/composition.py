@@ -3,19 +3,31 @@ Composition Relationship Documentation
 
 Overview:
 This module demonstrates the Composition relationship between Car, Engine, and Wheels classes.
-Composition is a "part-of" relationship where the contained objects are created and destroyed
-with the container object. The parts cannot exist independently of the whole.
+Composition is a "part-of" relationship: a car is made of an engine and four wheels, and
+only the car decides which parts it uses. Here the parts are immutable specifications
+shared between cars, so they outlive any single car, but no car can change a part that
+another car uses.
+
+Shared Parts (Flyweight):
+Engines and wheels are immutable specifications, so cars with the same spec
+share one interned object from a PartFactory instead of allocating an engine
+and four wheels each. A car never modifies a shared part: set_engine_power and
+set_wheel_size swap in another interned part for that car only (copy-on-write).
 
 Class Attributes:
 Engine:
-- power: Engine's power (integer)
+- power: Engine's power (integer, read-only)
 
 Wheels:
-- size: Wheel's size (integer)
+- size: Wheel's size (integer, read-only)
+
+PartFactory:
+- engines / wheels / wheel_sets: Interned engines, wheels and sets of 4 wheels
+- created / reused: Number of parts created and of requests served by a shared part
 
 Car:
-- engine: Engine instance (Engine object)
-- wheels: List of wheel instances (list of Wheels objects)
+- engine: Engine instance (Engine object, shared)
+- wheels: Tuple of the 4 wheel instances (shared)
 
 Methods:
 Engine:
@@ -24,25 +36,46 @@ Engine:
 Wheels:
 - __init__: Constructor - Initializes a new wheel
 
+PartFactory:
+- engine / wheel: Get the shared part for a spec
+- wheel_set: Get the shared tuple of wheels for a list of sizes
+
 Car:
-- __init__: Constructor - Initializes a car with engine and wheels
+- __init__: Constructor - Initializes a car with shared engine and wheels
 - see_engine_power: Displays the engine's power
 - see_wheels_size: Displays the size of all wheels
+- set_engine_power / set_wheel_size: Copy-on-write changes of one car's parts
+
+benchmark: Compares memory and construction time with one engine and four wheels per car
+(run with: python composition.py --benchmark)
+
+Shared parts can be pickled and copied: they are rebuilt through the shared
+PartFactory, so a copied car still uses the interned engine and wheels.
 
 Usage Example:
 car1 = Car(120, 16)  # Creates car with engine(power=120) and 4 wheels(size=16)
 car1.see_engine_power()  # Prints: 120
 car1.see_wheels_size()   # Prints: 16 (4 times, one for each wheel)
+car1.set_wheel_size(0, 17)  # Only car1's front-left wheel changes
 """
 
+import sys
+import time
+import tracemalloc
+
+
 class Engine:
     """
     A class to represent a car engine.
     
+    Engines are immutable so that many cars can share one.
+    
     Attributes:
         power (int): Engine's power
     """
 
+    __slots__ = ("power",)
+
     def __init__(self, power):
         """
         Initialize a new Engine instance.
@@ -50,16 +83,36 @@ class Engine:
         Args:
             power (int): Engine's power
         """
-        self.power = power
+        object.__setattr__(self, "power", power)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Engines are shared between cars, use Car.set_engine_power")
+
+    def __reduce__(self):
+        # Pickled and copied engines come back as the shared engine
+        return (_shared_engine, (self.power,))
+
+    def __eq__(self, other):
+        return isinstance(other, Engine) and self.power == other.power
+
+    def __hash__(self):
+        return hash(("Engine", self.power))
+
+    def __repr__(self):
+        return f"Engine({self.power})"
 
 class Wheels:
     """
     A class to represent a car wheel.
     
+    Wheels are immutable so that many cars can share one.
+    
     Attributes:
         size (int): Wheel's size
     """
 
+    __slots__ = ("size",)
+
     def __init__(self, size):
         """
         Initialize a new Wheels instance.
@@ -67,17 +120,127 @@ class Wheels:
         Args:
             size (int): Wheel's size
         """
-        self.size = size
+        object.__setattr__(self, "size", size)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Wheels are shared between cars, use Car.set_wheel_size")
+
+    def __reduce__(self):
+        # Pickled and copied wheels come back as the shared wheel
+        return (_shared_wheel, (self.size,))
+
+    def __eq__(self, other):
+        return isinstance(other, Wheels) and self.size == other.size
+
+    def __hash__(self):
+        return hash(("Wheels", self.size))
+
+    def __repr__(self):
+        return f"Wheels({self.size})"
+
+class PartFactory:
+    """
+    A class to intern car parts, so each spec exists only once.
+    
+    Attributes:
+        engines (dict): Shared engine of each power
+        wheels (dict): Shared wheel of each size
+        wheel_sets (dict): Shared tuple of wheels for each tuple of sizes
+        created (int): Number of parts created
+        reused (int): Number of requests answered with an existing part
+    """
+
+    def __init__(self):
+        """
+        Initialize a new, empty PartFactory instance.
+        """
+        self.engines : dict[int, Engine] = {}
+        self.wheels : dict[int, Wheels] = {}
+        self.wheel_sets : dict[tuple, tuple] = {}
+        self.created = 0
+        self.reused = 0
+
+    def engine(self, power):
+        """
+        Get the shared engine with a given power.
+        
+        Args:
+            power (int): Engine's power
+        
+        Returns:
+            Engine: The interned engine
+        """
+        engine = self.engines.get(power)
+        if engine is None:
+            engine = self.engines[power] = Engine(power)
+            self.created += 1
+        else:
+            self.reused += 1
+        return engine
+
+    def wheel(self, size):
+        """
+        Get the shared wheel with a given size.
+        
+        Args:
+            size (int): Wheel's size
+        
+        Returns:
+            Wheels: The interned wheel
+        """
+        wheel = self.wheels.get(size)
+        if wheel is None:
+            wheel = self.wheels[size] = Wheels(size)
+            self.created += 1
+        else:
+            self.reused += 1
+        return wheel
+
+    def wheel_set(self, sizes):
+        """
+        Get the shared tuple of wheels for some sizes.
+        
+        Args:
+            sizes (tuple): Size of each wheel
+        
+        Returns:
+            tuple: The interned wheels, in the same order as sizes
+        """
+        wheels = self.wheel_sets.get(sizes)
+        if wheels is None:
+            wheels = self.wheel_sets[sizes] = tuple(self.wheel(size) for size in sizes)
+        else:
+            self.reused += 1
+        return wheels
+
+
+# Factory shared by every Car
+parts = PartFactory()
+
+
+def _shared_engine(power):
+    """Get the shared engine of a power (used to unpickle and copy engines)."""
+    return parts.engine(power)
+
+
+def _shared_wheel(size):
+    """Get the shared wheel of a size (used to unpickle and copy wheels)."""
+    return parts.wheel(size)
 
 class Car:
     """
     A class to represent a car composed of engine and wheels.
     
     Attributes:
-        engine (Engine): The car's engine
-        wheels (list): List of wheel objects (always 4 wheels)
+        engine (Engine): The car's engine (shared with cars of the same power)
+        wheels (tuple): The 4 wheel objects (shared with cars of the same sizes)
+        factory (PartFactory): Factory providing the shared parts
     """
 
+    __slots__ = ("engine", "wheels")
+
+    factory = parts
+
     def __init__(self, power, size):
         """
         Initialize a new Car instance with engine and wheels.
@@ -86,8 +249,8 @@ class Car:
             power (int): Engine power for the car
             size (int): Size for all wheels of the car
         """
-        self.engine = Engine(power)
-        self.wheels = [Wheels(size) for _ in range(4)]
+        self.engine = self.factory.engine(power)
+        self.wheels = self.factory.wheel_set((size,) * 4)
 
     def see_engine_power(self):
         """
@@ -106,13 +269,97 @@ class Car:
         for wheel in self.wheels:
             print(wheel.size)
 
+    def set_engine_power(self, power):
+        """
+        Change the power of this car's engine.
+        
+        The shared engine is left untouched; the car switches to the shared
+        engine with the new power.
+        
+        Args:
+            power (int): New engine power
+        """
+        self.engine = self.factory.engine(power)
+
+    def set_wheel_size(self, index, size):
+        """
+        Change the size of one of this car's wheels.
+        
+        The shared wheels are left untouched; the car switches to the shared
+        set of wheels with the new sizes.
+        
+        Args:
+            index (int): Position of the wheel (0-3)
+            size (int): New wheel size
+        """
+        sizes = [wheel.size for wheel in self.wheels]
+        sizes[index] = size
+        self.wheels = self.factory.wheel_set(tuple(sizes))
+
+
+def _unshared_car(power, size):
+    """Build a car that owns a new engine and four new wheels (the layout before sharing)."""
+    car = Car.__new__(Car)
+    car.engine = Engine(power)
+    car.wheels = [Wheels(size) for _ in range(4)]
+    return car
+
+
+def _measure(build, specs):
+    """Return the memory (bytes) and time (seconds) to build one car per spec."""
+    start = time.perf_counter()
+    cars = [build(power, size) for power, size in specs]
+    elapsed = time.perf_counter() - start
+    del cars
+    # Memory is traced in a second pass, as tracing slows construction down
+    tracemalloc.start()
+    cars = [build(power, size) for power, size in specs]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del cars
+    return memory, elapsed
+
+
+def benchmark(n=100000, powers=(90, 100, 120, 150, 200), sizes=(14, 15, 16, 17)):
+    """
+    Compare shared parts with one engine and four wheels per car.
+    
+    Args:
+        n (int): Number of cars to build
+        powers (tuple): Engine powers used by the fleet
+        sizes (tuple): Wheel sizes used by the fleet
+    
+    Returns:
+        dict: Memory (bytes) and time (seconds) of each layout
+    """
+    specs = [(powers[i % len(powers)], sizes[i % len(sizes)]) for i in range(n)]
+    unshared = _measure(_unshared_car, specs)
+    shared = _measure(Car, specs)
+    print(f"Unshared parts: {unshared[0] / n:.0f} bytes per car, built in {unshared[1]:.3f}s")
+    print(f"Shared parts: {shared[0] / n:.0f} bytes per car, built in {shared[1]:.3f}s")
+    return {"unshared": unshared, "shared": shared}
+
+
+def main():
+    """Demonstrate the composition of cars and their shared parts."""
+    car1 = Car(120, 16)
+    car2 = Car(100, 14)
+
+    car1.see_engine_power()
+    car1.see_wheels_size()
 
-car1 = Car(120, 16)
-car2 = Car(100, 14)
+    car2.see_engine_power()
+    car2.see_wheels_size()
 
-car1.see_engine_power()
-car1.see_wheels_size()
+    # Changing one car's wheel does not change the other cars
+    car3 = Car(120, 16)
+    car1.set_wheel_size(0, 17)
+    car1.see_wheels_size()
+    car3.see_wheels_size()
 
-car2.see_engine_power()
-car2.see_wheels_size()
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        main()
 
@@ -0,0 +1,384 @@
+"""
+Fleet Store Documentation
+
+Overview:
+A Fleet keeps many composed cars (composition.py) as columns instead of Car
+objects: the engine power of every car in one typed array and the sizes of
+all wheels in another, four per car. Aggregates and filters run over whole
+columns with C-level builtins (Counter, slicing, zip, compress) instead of
+calling see_engine_power() / see_wheels_size() car by car.
+
+Columns:
+- power: Engine power of each car (array of unsigned 32-bit integers)
+- wheel_sizes: Wheel sizes, 4 consecutive entries per car (array of unsigned 16-bit integers)
+
+Adding Cars:
+Every power and wheel size is converted to its column type before anything
+is stored, so a rejected value (negative, too large or not an integer)
+raises TypeError or OverflowError and leaves the columns in step.
+
+Views:
+fleet.car(index) returns a FleetCar, a Car whose engine and wheels are read
+from the columns (as shared parts of the PartFactory). Its set_engine_power
+and set_wheel_size write back to the fleet.
+
+Aggregates and Filters:
+- power_histogram: Number of cars per power range
+- wheel_size_counts: Number of cars per wheel size
+- select: Indexes of the cars matching power and wheel size conditions
+
+Usage Example:
+fleet = Fleet()
+fleet.add(120, 16)
+fleet.add_many([(100, 14), (150, 16)])
+fleet.power_histogram(50)   # {100: 2, 150: 1}
+fleet.wheel_size_counts()   # {16: 2, 14: 1}
+fleet.select(min_power=110, wheel_size=16)  # [0, 2]
+fleet.car(0).see_engine_power()  # Prints: 120
+"""
+
+import random
+import time
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+
+from composition import Car
+
+WHEELS = 4
+
+
+class FleetCar(Car):
+    """
+    A Car view over one row of a Fleet.
+
+    Attributes:
+        fleet (Fleet): The fleet holding the car's data
+        index (int): Position of the car in the fleet
+    """
+
+    __slots__ = ("fleet", "index")
+
+    def __init__(self, fleet, index):
+        """
+        Initialize a new FleetCar view.
+
+        Args:
+            fleet (Fleet): The fleet holding the car's data
+            index (int): Position of the car in the fleet
+        """
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def engine(self):
+        """Get the car's engine as a shared part."""
+        return self.factory.engine(self.fleet.power[self.index])
+
+    @property
+    def wheels(self):
+        """Get the car's wheels as a shared tuple of parts."""
+        return self.factory.wheel_set(tuple(self.fleet.sizes_of(self.index)))
+
+    def set_engine_power(self, power):
+        """
+        Change the power of this car's engine in the fleet.
+
+        Args:
+            power (int): New engine power
+        """
+        self.fleet.power[self.index] = power
+
+    def set_wheel_size(self, index, size):
+        """
+        Change the size of one of this car's wheels in the fleet.
+
+        Args:
+            index (int): Position of the wheel (0-3)
+            size (int): New wheel size
+
+        Raises:
+            IndexError: If index is not between 0 and 3
+        """
+        if not 0 <= index < WHEELS:
+            raise IndexError("Wheel index must be between 0 and 3")
+        self.fleet.wheel_sizes[self.index * WHEELS + index] = size
+
+
+class Fleet:
+    """
+    A class to store many cars as typed columns.
+
+    Attributes:
+        power (array): Engine power of each car
+        wheel_sizes (array): Sizes of the wheels, 4 consecutive entries per car
+    """
+
+    def __init__(self):
+        """
+        Initialize a new, empty Fleet instance.
+        """
+        self.power = array("I")
+        self.wheel_sizes = array("H")
+
+    def __len__(self):
+        """Return the number of cars."""
+        return len(self.power)
+
+    def add(self, power, size):
+        """
+        Add a car whose four wheels have the same size.
+
+        Args:
+            power (int): Engine power
+            size (int): Size of all the wheels
+
+        Returns:
+            int: Index of the new car
+
+        Raises:
+            TypeError: If a value is not an integer
+            OverflowError: If a value does not fit its column
+        """
+        sizes = array(self.wheel_sizes.typecode, repeat(size, WHEELS))
+        self._append(power, sizes)
+        return len(self.power) - 1
+
+    def _append(self, power, sizes):
+        """Append a car whose wheel sizes are already converted to an array."""
+        if len(sizes) != WHEELS:
+            raise ValueError(f"A car needs {WHEELS} wheels, got {len(sizes)}")
+        self.power.append(power)
+        self.wheel_sizes.extend(sizes)
+
+    def add_car(self, car):
+        """
+        Add a copy of a Car.
+
+        Args:
+            car (Car): The car to copy
+
+        Returns:
+            int: Index of the new car
+
+        Raises:
+            ValueError: If the car does not have 4 wheels
+            TypeError: If a value is not an integer
+            OverflowError: If a value does not fit its column
+        """
+        sizes = array(self.wheel_sizes.typecode, (wheel.size for wheel in car.wheels))
+        self._append(car.engine.power, sizes)
+        return len(self.power) - 1
+
+    def add_many(self, rows):
+        """
+        Add many cars at once.
+
+        Every row is converted first, so a rejected value adds no car at all.
+
+        Args:
+            rows (iterable): (power, size) pairs, one per car
+
+        Raises:
+            TypeError: If a value is not an integer
+            OverflowError: If a value does not fit its column
+        """
+        powers = array(self.power.typecode)
+        sizes = array(self.wheel_sizes.typecode)
+        for power, size in rows:
+            powers.append(power)
+            sizes.extend(repeat(size, WHEELS))
+        self.power.extend(powers)
+        self.wheel_sizes.extend(sizes)
+
+    @classmethod
+    def from_cars(cls, cars):
+        """
+        Build a fleet from Car objects.
+
+        Args:
+            cars (iterable): The cars to copy
+
+        Returns:
+            Fleet: A fleet with one row per car
+        """
+        fleet = cls()
+        for car in cars:
+            fleet.add_car(car)
+        return fleet
+
+    def car(self, index):
+        """
+        Get a Car view of a row.
+
+        Args:
+            index (int): Position of the car
+
+        Returns:
+            FleetCar: A view that reads and writes the fleet's columns
+
+        Raises:
+            IndexError: If there is no car at that position
+        """
+        if not 0 <= index < len(self.power):
+            raise IndexError(f"No car at position {index}")
+        return FleetCar(self, index)
+
+    def __iter__(self):
+        """Iterate over Car views of every row."""
+        return (FleetCar(self, index) for index in range(len(self.power)))
+
+    def sizes_of(self, index):
+        """
+        Get the wheel sizes of a car.
+
+        Args:
+            index (int): Position of the car
+
+        Returns:
+            array: The 4 wheel sizes
+        """
+        start = index * WHEELS
+        return self.wheel_sizes[start:start + WHEELS]
+
+    def total_power(self):
+        """Return the sum of the engine power of every car."""
+        return sum(self.power)
+
+    def mean_power(self):
+        """Return the average engine power (0.0 for an empty fleet)."""
+        return sum(self.power) / len(self.power) if self.power else 0.0
+
+    def power_histogram(self, width=10):
+        """
+        Count the cars in each power range.
+
+        Powers are counted in one C-level pass and then folded into ranges,
+        so the Python work depends on the number of distinct powers only.
+
+        Args:
+            width (int): Width of each range
+
+        Returns:
+            dict: For each range start (a multiple of width), the number of cars,
+            in increasing order
+        """
+        histogram = {}
+        for power, count in sorted(Counter(self.power).items()):
+            start = power - power % width
+            histogram[start] = histogram.get(start, 0) + count
+        return histogram
+
+    def wheel_set_counts(self):
+        """
+        Count the cars with each combination of wheel sizes.
+
+        Returns:
+            Counter: For each tuple of 4 sizes, the number of cars
+        """
+        return Counter(zip(*self._wheel_columns()))
+
+    def wheel_size_counts(self, position=None):
+        """
+        Count the cars per wheel size.
+
+        Args:
+            position (int): Only look at the wheel at this position (0-3);
+                by default a car counts once for each size among its wheels
+
+        Returns:
+            dict: For each wheel size, the number of cars, most common first
+        """
+        if position is not None:
+            return dict(Counter(self.wheel_sizes[position::WHEELS]).most_common())
+        counts = Counter()
+        for sizes, count in self.wheel_set_counts().items():
+            for size in set(sizes):
+                counts[size] += count
+        return dict(counts.most_common())
+
+    def _power_mask(self, min_power, max_power):
+        """Build a mask of the cars within a power range."""
+        if min_power is None:
+            min_power = 0
+        if max_power is None:
+            max_power = max(self.power, default=0)
+        # Map every distinct power once, then translate the whole column
+        accepted = {power: min_power <= power <= max_power for power in set(self.power)}
+        return bytes(map(accepted.__getitem__, self.power))
+
+    def _wheel_columns(self):
+        """Split the wheel sizes into one column per wheel position."""
+        return [self.wheel_sizes[position::WHEELS] for position in range(WHEELS)]
+
+    def _size_mask(self, wheel_size):
+        """Build a mask of the cars with at least one wheel of a size."""
+        # Few distinct wheel combinations exist, so test each combination once
+        matching = {sizes for sizes in self.wheel_set_counts() if wheel_size in sizes}
+        return bytes(map(matching.__contains__, zip(*self._wheel_columns())))
+
+    def select(self, min_power=None, max_power=None, wheel_size=None):
+        """
+        Find the cars matching every given condition.
+
+        Args:
+            min_power (int): Lowest engine power (inclusive)
+            max_power (int): Highest engine power (inclusive)
+            wheel_size (int): A size that at least one wheel must have
+
+        Returns:
+            list: Indexes of the matching cars, in order
+        """
+        indexes = range(len(self.power))
+        if min_power is not None or max_power is not None:
+            indexes = compress(indexes, self._power_mask(min_power, max_power))
+        if wheel_size is not None:
+            mask = self._size_mask(wheel_size)
+            indexes = (index for index in indexes if mask[index])
+        return list(indexes)
+
+    def memory_bytes(self):
+        """Return the bytes used by the columns' data."""
+        return self.power.itemsize * len(self.power) + self.wheel_sizes.itemsize * len(self.wheel_sizes)
+
+
+def generate_fleet(n, seed=None, powers=(90, 100, 120, 150, 200), sizes=(14, 15, 16, 17)):
+    """
+    Build a random fleet for benchmarks.
+
+    Args:
+        n (int): Number of cars
+        seed: Seed for reproducible fleets
+        powers (tuple): Engine powers to choose from
+        sizes (tuple): Wheel sizes to choose from
+
+    Returns:
+        Fleet: The fleet
+    """
+    rng = random.Random(seed)
+    fleet = Fleet()
+    fleet.power = array("I", (rng.choice(powers) for _ in range(n)))
+    fleet.wheel_sizes = array("H", (size for _ in range(n) for size in repeat(rng.choice(sizes), WHEELS)))
+    return fleet
+
+
+def main():
+    """Run fleet analytics on a large random fleet."""
+    fleet = generate_fleet(1000000, seed=1)
+    fleet.car(0).set_wheel_size(0, 18)
+    print(f"{len(fleet)} cars in {fleet.memory_bytes() / 1e6:.1f} MB of column data")
+
+    start = time.perf_counter()
+    print("Power distribution:", fleet.power_histogram(50))
+    print("Cars per wheel size:", fleet.wheel_size_counts())
+    print(f"Average power: {fleet.mean_power():.1f}")
+    selected = fleet.select(min_power=120, max_power=150, wheel_size=16)
+    print(f"{len(selected)} cars with 120-150 power and 16 inch wheels")
+    print(f"Aggregates and filter in {time.perf_counter() - start:.3f}s")
+
+    car = fleet.car(selected[0])
+    car.see_engine_power()
+    car.see_wheels_size()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+Full-Text Index Documentation
+
+Overview:
+This module implements an inverted index used by Library (aggregation.py) for
+ranked keyword search over book titles and authors. For every token it keeps
+a posting list: the documents containing the token and how many times.
+
+Structure:
+- Memory segment: new documents are added to plain Python lists, so adding a
+  document only costs as much as its number of tokens
+- Compressed segments: when the memory segment reaches flush_size documents
+  it is frozen into a segment where each posting list is a byte string of
+  variable-length integers (document ID deltas and term frequencies)
+- Merge policy: after each flush, whenever the newest merge_factor segments
+  are of the same size class (none of them merge_factor times bigger than the
+  newest), they are merged into one. Each document is merged about
+  log(documents) / log(merge_factor) times, so add() stays amortized
+  O(tokens) and a search only visits a logarithmic number of segments
+- merge() combines every segment into one (for example after a bulk load)
+
+Removed Documents:
+remove() only marks a document as deleted. merge() drops the postings of the
+deleted documents and moves their IDs to a free list, so the next add() can
+reuse them (next_id() tells which ID comes next) and the per-document data
+does not grow with every document ever indexed. flush() runs merge() by
+itself once deleted documents outnumber the live ones, so the cost is
+amortized over the documents added since.
+
+Queries:
+- Tokens are matched after normalization (case, accents and punctuation are ignored)
+- mode="and" returns documents containing every token, mode="or" any token
+- Results are ranked with BM25
+
+Functions:
+- normalize: Normalizes text for lookups
+- tokenize: Splits text into normalized tokens
+- encode_varints / decode_varints: Variable-length integer compression
+
+Usage Example:
+index = TextIndex()
+index.add(0, "The Great Gatsby F. Scott Fitzgerald")
+index.add(1, "Great Expectations Charles Dickens")
+index.search("great gatsby", mode="and")  # [(0, 1.2...)]
+index.search("great gatsby", mode="or")   # [(0, 1.2...), (1, 0.1...)]
+"""
+
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+
+TOKEN = re.compile(r"\w+")
+
+
+def normalize(text):
+    """
+    Normalize text for index lookups.
+
+    Accents are removed, letters are case-folded and runs of whitespace
+    become a single space, so "  The GREAT  Gátsby" and "the great gatsby"
+    have the same key.
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        str: The normalized text
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(without_accents.casefold().split())
+
+
+def tokenize(text):
+    """
+    Split text into normalized word tokens.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: The tokens, in order
+    """
+    return TOKEN.findall(normalize(text))
+
+
+def encode_varints(values):
+    """
+    Encode non-negative integers with 7 bits per byte.
+
+    Args:
+        values (iterable): Non-negative integers
+
+    Returns:
+        bytes: The encoded integers
+    """
+    encoded = bytearray()
+    for value in values:
+        while value >= 0x80:
+            encoded.append((value & 0x7F) | 0x80)
+            value >>= 7
+        encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varints(data):
+    """
+    Decode integers written by encode_varints.
+
+    Args:
+        data (bytes): The encoded integers
+
+    Yields:
+        int: The decoded integers, in order
+    """
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = 0
+            shift = 0
+
+
+class Segment:
+    """
+    An immutable set of compressed posting lists.
+
+    Attributes:
+        postings (dict): For each token, a byte string of alternating
+            document ID deltas and term frequencies
+        doc_freq (dict): Number of documents containing each token
+        docs (int): Number of documents in the segment
+    """
+
+    def __init__(self, postings_lists, docs):
+        """
+        Compress posting lists into a new Segment.
+
+        Args:
+            postings_lists (dict): For each token, (doc_id, frequency) pairs;
+                reused document IDs may come out of order, so they are sorted here
+            docs (int): Number of documents in the segment
+        """
+        self.postings : dict[str, bytes] = {}
+        self.doc_freq : dict[str, int] = {}
+        self.docs = docs
+        for token, pairs in postings_lists.items():
+            values = []
+            previous = 0
+            for doc_id, frequency in sorted(pairs):
+                values.append(doc_id - previous)
+                values.append(frequency)
+                previous = doc_id
+            self.postings[token] = encode_varints(values)
+            self.doc_freq[token] = len(pairs)
+
+    def pairs(self, token):
+        """
+        Decompress the posting list of a token.
+
+        Args:
+            token (str): The token
+
+        Returns:
+            list: (doc_id, frequency) pairs sorted by doc_id
+        """
+        data = self.postings.get(token)
+        if data is None:
+            return []
+        values = decode_varints(data)
+        pairs = []
+        doc_id = 0
+        for delta in values:
+            doc_id += delta
+            pairs.append((doc_id, next(values)))
+        return pairs
+
+
+class TextIndex:
+    """
+    A class to search documents by keyword with BM25 ranking.
+
+    Attributes:
+        segments (list): Compressed segments, oldest first
+        memory (dict): Posting lists of the documents not flushed yet
+        memory_docs (int): Number of documents in the memory segment
+        doc_lengths (array): Number of tokens of each document, by doc_id
+        deleted (set): IDs of removed documents whose postings are still stored
+        free (list): IDs released by merge, reused by the next documents
+        flush_size (int): Number of documents that triggers a flush
+        merge_factor (int): Number of same-size segments merged together
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, flush_size=1000, merge_factor=10):
+        """
+        Initialize a new, empty TextIndex instance.
+
+        Args:
+            flush_size (int): Number of documents kept uncompressed before
+                the memory segment is frozen into a compressed segment
+            merge_factor (int): Number of same-size segments merged together
+                (at least 2)
+        """
+        self.segments : list[Segment] = []
+        self.memory : dict[str, list[tuple[int, int]]] = {}
+        self.memory_docs = 0
+        self.doc_lengths = array("L")
+        self.total_length = 0
+        self.deleted : set[int] = set()
+        self.free : list[int] = []
+        self.flush_size = flush_size
+        self.merge_factor = max(2, merge_factor)
+
+    def __len__(self):
+        """Return the number of searchable documents."""
+        return len(self.doc_lengths) - len(self.deleted) - len(self.free)
+
+    def next_id(self):
+        """
+        Get the ID that the next added document must use.
+
+        Returns:
+            int: A released ID if there is one, otherwise a new ID
+        """
+        return self.free[-1] if self.free else len(self.doc_lengths)
+
+    def add(self, doc_id, text):
+        """
+        Index a document.
+
+        Document IDs are given out by next_id(): new IDs in increasing order,
+        starting at 0 and without gaps (for example the position of a book in
+        a library), or an ID released by merge().
+
+        Args:
+            doc_id (int): ID of the document
+            text (str): Text of the document
+
+        Raises:
+            ValueError: If doc_id is not the next document ID
+        """
+        if doc_id != self.next_id():
+            raise ValueError(f"Expected document {self.next_id()}, got {doc_id}")
+        tokens = tokenize(text)
+        if self.free:
+            self.free.pop()
+            self.doc_lengths[doc_id] = len(tokens)
+        else:
+            self.doc_lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        for token, frequency in Counter(tokens).items():
+            self.memory.setdefault(token, []).append((doc_id, frequency))
+        self.memory_docs += 1
+        if self.memory_docs >= self.flush_size:
+            self.flush()
+
+    def remove(self, doc_id):
+        """
+        Stop returning a document in search results.
+
+        Args:
+            doc_id (int): ID of the document
+        """
+        if doc_id not in self.deleted:
+            self.deleted.add(doc_id)
+            self.total_length -= self.doc_lengths[doc_id]
+
+    def flush(self):
+        """
+        Freeze the memory segment into a compressed segment.
+
+        Every segment is merged as well when deleted documents outnumber the
+        live ones, so their postings and IDs are released. Otherwise the
+        newest segments are merged following the merge policy.
+        """
+        if self.memory_docs:
+            self._freeze()
+            if len(self.deleted) > len(self):
+                self.merge()
+                return
+            factor = self.merge_factor
+            while len(self.segments) >= factor and self.segments[-factor].docs < factor * self.segments[-1].docs:
+                self.segments[-factor:] = [self._merge_segments(self.segments[-factor:])]
+
+    def _freeze(self):
+        """Compress the memory segment into a new segment."""
+        if self.memory_docs:
+            self.segments.append(Segment(self.memory, self.memory_docs))
+            self.memory = {}
+            self.memory_docs = 0
+
+    def merge(self):
+        """
+        Merge every segment (and the memory segment) into one segment.
+
+        Postings of removed documents are dropped while merging and their IDs
+        are released: trailing ones are forgotten, the others are reused by add().
+        """
+        self._freeze()
+        if len(self.segments) <= 1 and not self.deleted:
+            return
+        # Documents removed while merging stay deleted for the next merge
+        deleted = self.deleted
+        self.deleted = set()
+        merged = self._merge_segments(self.segments, deleted)
+        self.segments = [merged] if merged.docs else []
+        self._release(deleted)
+
+    def _merge_segments(self, segments, deleted=None):
+        """
+        Combine segments into one, dropping the postings of deleted documents.
+
+        Args:
+            segments (list): The segments to combine
+            deleted (set): IDs to drop (by default the currently deleted ones)
+
+        Returns:
+            Segment: The combined segment
+        """
+        if deleted is None:
+            deleted = self.deleted
+        merged : dict[str, list[tuple[int, int]]] = {}
+        doc_ids = set()
+        for segment in segments:
+            for token in segment.postings:
+                pairs = [pair for pair in segment.pairs(token) if pair[0] not in deleted]
+                if pairs:
+                    merged.setdefault(token, []).extend(pairs)
+                    doc_ids.update(doc_id for doc_id, _ in pairs)
+        return Segment(merged, len(doc_ids))
+
+    def _release(self, doc_ids):
+        """Put the IDs of purged documents on the free list, dropping trailing ones."""
+        free = set(self.free)
+        free.update(doc_ids)
+        for doc_id in doc_ids:
+            self.doc_lengths[doc_id] = 0
+        end = len(self.doc_lengths)
+        while end and end - 1 in free:
+            end -= 1
+            free.discard(end)
+        del self.doc_lengths[end:]
+        # Lowest IDs last, so they are reused first
+        self.free = sorted(free, reverse=True)
+
+    def _postings(self, token):
+        """Collect the live (doc_id, frequency) pairs of a token in every segment."""
+        postings = {}
+        for segment in self.segments:
+            postings.update(segment.pairs(token))
+        postings.update(self.memory.get(token, ()))
+        for doc_id in self.deleted.intersection(postings):
+            del postings[doc_id]
+        return postings
+
+    def search(self, query, mode="and", limit=10):
+        """
+        Find the documents that best match a query.
+
+        Args:
+            query (str): Keywords to search for
+            mode (str): "and" to require every keyword, "or" for any keyword
+            limit (int): Maximum number of results
+
+        Returns:
+            list: (doc_id, score) pairs, best match first
+
+        Raises:
+            ValueError: If mode is not "and" or "or"
+        """
+        if mode not in ("and", "or"):
+            raise ValueError("Mode must be 'and' or 'or'")
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or len(self) == 0:
+            return []
+        postings = [self._postings(token) for token in tokens]
+        if mode == "and":
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = set().union(*postings)
+        docs = len(self)
+        average_length = self.total_length / docs or 1
+        scores = dict.fromkeys(candidates, 0.0)
+        for token_postings in postings:
+            if not token_postings:
+                continue
+            df = len(token_postings)
+            idf = math.log(1 + (docs - df + 0.5) / (df + 0.5))
+            for doc_id, frequency in token_postings.items():
+                if doc_id in scores:
+                    length_norm = 1 - self.B + self.B * self.doc_lengths[doc_id] / average_length
+                    scores[doc_id] += idf * frequency * (self.K1 + 1) / (frequency + self.K1 * length_norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
@@ -18,7 +18,8 @@ Vehicle:
 - model: Vehicle model name (string)
 
 Electric:
-- battery: Battery capacity (string)
+- battery: Battery capacity (string such as '100kWh')
+- energy: Battery capacity parsed into an Energy quantity (see units.py)
 
 Car:
 - brand, model: Inherited from Vehicle
@@ -71,6 +72,8 @@ car1 = ElectricCar('Tesla', 'Model 3', 'Red', '100kWh')
 car1.see_info()  # Prints: Brand: Tesla, Model: Model 3, Color: Red, Battery: 100kWh
 """
 
+from units import parse_energy
+
 #Father Class
 class Vehicle:
     """
@@ -113,6 +116,7 @@ class Electric():
     
     Attributes:
         battery (str): The battery capacity of the electric vehicle
+        energy (Energy): The battery capacity as a number of watt-hours
     """
 
     def __init__(self, battery):
@@ -121,9 +125,23 @@ class Electric():
         
         Args:
             battery (str): The battery capacity (e.g., '100kWh')
+        
+        Raises:
+            ValueError: If battery is not a number followed by Wh, kWh or MWh
         """
+        parse_energy(battery)
         self.battery = battery
 
+    @property
+    def energy(self):
+        """
+        Get the battery capacity as a quantity.
+        
+        Returns:
+            Energy: The parsed capacity (parsing is cached for repeated texts)
+        """
+        return parse_energy(self.battery)
+
     def see_battery(self):
         """
         Print the battery capacity information.
@@ -301,11 +319,16 @@ class ElectricCar(Car, Electric):
         Car.see_color(self)
         Electric.see_battery(self)
 
-print("Truck:")
-truck1 = Truck('Ford', 'F-150', 'Black', 1000)
-truck1.see_load_capacity()
+def main():
+    """Demonstrate the vehicle hierarchy."""
+    print("Truck:")
+    truck1 = Truck('Ford', 'F-150', 'Black', 1000)
+    truck1.see_load_capacity()
 
-print("\n")
-print("Electric Car:")
-car1 = ElectricCar('Tesla', 'Model 3', 'Red', '100kWh')
-car1.see_info()
\ No newline at end of file
+    print("\n")
+    print("Electric Car:")
+    car1 = ElectricCar('Tesla', 'Model 3', 'Red', '100kWh')
+    car1.see_info()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,628 @@
+"""
+Vehicle Inventory Documentation
+
+Overview:
+An Inventory stores a large, mixed collection of vehicles (Inheritance.py)
+without keeping one Python object per vehicle. Each concrete class has its
+own columnar table with one typed array per constructor field, and queries
+such as the total load capacity of Ford trucks run directly over the columns.
+
+Storage:
+- Text fields (brand, model, color, battery) are dictionary-encoded: each
+  distinct string is stored once and the table keeps integer codes
+- The dictionaries are shared by every table, so "Ford" has the same code in
+  the Car, Truck and ElectricCar tables
+- Number fields (cc, load_capacity) are arrays of 64-bit integers
+- Derived fields are computed when a row is stored: battery_wh keeps the
+  battery text of electric cars parsed into watt-hours (see units.py), so
+  energy totals and ranges are numeric column operations
+
+Queries:
+Queries take a class and match every table of that class or its subclasses
+that has the requested field (for example Car matches the Car, Truck and
+ElectricCar tables). Keyword filters compare field values for equality; text
+filters are turned into a code once and compared as integers. A (low, high)
+tuple filters a number field by an inclusive range (None for no bound).
+- count: Number of matching vehicles
+- total / mean: Sum and average of a number field
+- total_energy: Sum of the battery capacities as an Energy
+- mean_by / count_by: The same, grouped by another field (for example by brand)
+
+Lazy Views:
+inventory.vehicle(cls, index) and inventory.vehicles(cls) return row views:
+objects of a generated subclass of the stored class (for example TruckRow)
+whose attributes read and write the columns. They can be passed to code
+that expects the original class, such as truck.see_load_capacity().
+
+Usage Example:
+inventory = Inventory()
+inventory.add(Truck('Ford', 'F-150', 'Black', 1000))
+inventory.add_rows(Motorcycle, [('Honda', 'CB500', 500), ('Yamaha', 'MT-07', 689)])
+inventory.total(Truck, "load_capacity", brand="Ford")  # 1000
+inventory.mean_by(Motorcycle, "cc", "brand")           # {'Honda': 500.0, 'Yamaha': 689.0}
+inventory.count(ElectricCar, battery_wh=(60000, None))  # Electric cars with at least 60kWh
+inventory.vehicle(Truck, 0).see_load_capacity()        # Same output as the Truck object
+"""
+
+import random
+import time
+import tracemalloc
+from array import array
+from itertools import compress, repeat
+from operator import eq
+
+from Inheritance import Car, ElectricCar, Motorcycle, Truck, Vehicle
+from units import Energy, parse_energy
+
+# Constructor fields of each class that can be stored, in constructor order
+SCHEMAS = {
+    Vehicle: ("brand", "model"),
+    Car: ("brand", "model", "color"),
+    Motorcycle: ("brand", "model", "cc"),
+    Truck: ("brand", "model", "color", "load_capacity"),
+    ElectricCar: ("brand", "model", "color", "battery"),
+}
+
+# Type of each field: text fields are dictionary-encoded
+FIELD_TYPES = {
+    "brand": str,
+    "model": str,
+    "color": str,
+    "battery": str,
+    "cc": int,
+    "load_capacity": int,
+    "battery_wh": float,
+}
+
+# Array type code of each field type (text fields store codes)
+TYPECODES = {str: "I", int: "q", float: "d"}
+
+# Fields computed from another field: source field -> (field, function)
+DERIVED = {
+    "battery": ("battery_wh", lambda battery: parse_energy(battery).wh),
+}
+
+
+class StringDictionary:
+    """
+    A class to encode strings as small integer codes.
+
+    Attributes:
+        codes (dict): Code of each string
+        values (list): String of each code
+    """
+
+    def __init__(self):
+        """
+        Initialize a new, empty StringDictionary instance.
+        """
+        self.codes : dict[str, int] = {}
+        self.values : list[str] = []
+
+    def __len__(self):
+        """Return the number of distinct strings."""
+        return len(self.values)
+
+    def encode(self, value):
+        """
+        Get the code of a string, adding it if it is new.
+
+        Args:
+            value (str): The string
+
+        Returns:
+            int: Its code
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code_of(self, value):
+        """
+        Get the code of a string without adding it.
+
+        Args:
+            value (str): The string
+
+        Returns:
+            int: Its code, or None if the string was never encoded
+        """
+        return self.codes.get(value)
+
+
+class VehicleTable:
+    """
+    A class to store the vehicles of one class as columns.
+
+    Attributes:
+        cls (type): The stored class
+        fields (tuple): Constructor fields, one column each
+        columns (dict): Array of each field (codes for text fields),
+            including the derived fields
+        dictionaries (dict): Shared StringDictionary of each text field
+    """
+
+    def __init__(self, cls, dictionaries):
+        """
+        Initialize a new, empty VehicleTable instance.
+
+        Args:
+            cls (type): The stored class (a key of SCHEMAS)
+            dictionaries (dict): Shared StringDictionary of each text field
+        """
+        self.cls = cls
+        self.fields = SCHEMAS[cls]
+        self.dictionaries = dictionaries
+        self.columns = {}
+        for field in self.fields:
+            self.columns[field] = array(TYPECODES[FIELD_TYPES[field]])
+            if field in DERIVED:
+                derived = DERIVED[field][0]
+                self.columns[derived] = array(TYPECODES[FIELD_TYPES[derived]])
+        self._row_class = None
+
+    def __len__(self):
+        """Return the number of stored vehicles."""
+        return len(self.columns[self.fields[0]])
+
+    def append(self, values):
+        """
+        Store one vehicle given its constructor values.
+
+        Every value is converted before anything is stored, and a value the
+        columns reject undoes the partial row, so columns never get out of step.
+
+        Args:
+            values (tuple): One value per field, in constructor order
+
+        Returns:
+            int: Index of the new row
+
+        Raises:
+            ValueError: If the number of values does not match the fields
+            TypeError: If a value does not fit its column
+            OverflowError: If a number is too large for its column
+        """
+        if len(values) != len(self.fields):
+            raise ValueError(f"{self.cls.__name__} needs {len(self.fields)} values, got {len(values)}")
+        row = []
+        for field, value in zip(self.fields, values):
+            row.extend(self._encode(field, value))
+        appended = []
+        try:
+            for field, value in row:
+                self.columns[field].append(value)
+                appended.append(field)
+        except (TypeError, OverflowError):
+            for field in appended:
+                self.columns[field].pop()
+            raise
+        return len(self) - 1
+
+    def _encode(self, field, value):
+        """
+        Convert a field value to the (column, stored value) pairs it fills.
+
+        Raises:
+            TypeError: If a text field gets something other than a string
+        """
+        pairs = []
+        if field in DERIVED:
+            derived, compute = DERIVED[field]
+            pairs.append((derived, compute(value)))
+        dictionary = self.dictionaries.get(field)
+        if dictionary is not None:
+            if not isinstance(value, str):
+                raise TypeError(f"{field} must be a string, got {value!r}")
+            value = dictionary.encode(value)
+        pairs.append((field, value))
+        return pairs
+
+    def get(self, field, index):
+        """Read a field of a row, decoding text fields."""
+        value = self.columns[field][index]
+        dictionary = self.dictionaries.get(field)
+        return value if dictionary is None else dictionary.values[value]
+
+    def set(self, field, index, value):
+        """Write a field of a row, encoding text fields and updating derived fields."""
+        pairs = self._encode(field, value)
+        # Check every value fits before writing, so a field and its derived field stay in step
+        for name, stored in pairs:
+            array(self.columns[name].typecode, (stored,))
+        for name, stored in pairs:
+            self.columns[name][index] = stored
+
+    def mask(self, filters):
+        """
+        Build a mask of the rows matching filters.
+
+        Args:
+            filters (dict): Field -> value pairs that must all match, or
+                field -> (low, high) inclusive ranges for number fields
+
+        Raises:
+            ValueError: If a range is given for a text field
+
+        Returns:
+            bytes: 1 for each matching row and 0 otherwise, or None when no
+            filter is given
+        """
+        mask = None
+        for field, value in filters.items():
+            dictionary = self.dictionaries.get(field)
+            column = self.columns[field]
+            if isinstance(value, tuple):
+                if dictionary is not None:
+                    raise ValueError(f"{field} is not a number field")
+                low, high = value
+                # Test each distinct value once, then translate the whole column
+                accepted = {item: (low is None or item >= low) and (high is None or item <= high)
+                            for item in set(column)}
+                matches = bytes(map(accepted.__getitem__, column))
+                mask = matches if mask is None else bytes(map(min, mask, matches))
+                continue
+            if dictionary is not None:
+                value = dictionary.code_of(value)
+                if value is None:
+                    return bytes(len(self))
+            # operator.eq also compares ints with floats (battery_wh=60000)
+            matches = bytes(map(eq, repeat(value), column))
+            mask = matches if mask is None else bytes(map(min, mask, matches))
+        return mask
+
+    def selected(self, field, filters):
+        """Iterate over the raw values of a field in the rows matching filters."""
+        mask = self.mask(filters)
+        column = self.columns[field]
+        return iter(column) if mask is None else compress(column, mask)
+
+    def row_class(self):
+        """Get (and create once) the row view subclass of the stored class."""
+        if self._row_class is None:
+            namespace = {"__slots__": ("table", "index"), "__init__": _row_init}
+            for field in self.fields:
+                namespace[field] = property(
+                    lambda row, field=field: row.table.get(field, row.index),
+                    lambda row, value, field=field: row.table.set(field, row.index, value))
+            self._row_class = type(f"{self.cls.__name__}Row", (self.cls,), namespace)
+        return self._row_class
+
+
+def _row_init(self, table, index):
+    """Point a row view at a row of a table."""
+    self.table = table
+    self.index = index
+
+
+class Inventory:
+    """
+    A class to store vehicles of every class in columnar tables.
+
+    Attributes:
+        tables (dict): VehicleTable of each stored class
+        dictionaries (dict): StringDictionary of each text field, shared by every table
+    """
+
+    def __init__(self):
+        """
+        Initialize a new, empty Inventory instance.
+        """
+        self.dictionaries = {field: StringDictionary() for field, kind in FIELD_TYPES.items() if kind is str}
+        self.tables : dict[type, VehicleTable] = {}
+
+    def __len__(self):
+        """Return the number of stored vehicles."""
+        return sum(len(table) for table in self.tables.values())
+
+    def table(self, cls):
+        """
+        Get the table of a class, creating it on first use.
+
+        Args:
+            cls (type): A class of Inheritance.py
+
+        Returns:
+            VehicleTable: The table storing that exact class
+
+        Raises:
+            KeyError: If the class has no schema
+        """
+        table = self.tables.get(cls)
+        if table is None:
+            if cls not in SCHEMAS:
+                raise KeyError(f"{cls.__name__} cannot be stored in the inventory")
+            table = self.tables[cls] = VehicleTable(cls, self.dictionaries)
+        return table
+
+    def add(self, vehicle):
+        """
+        Store a vehicle.
+
+        Args:
+            vehicle (Vehicle): The vehicle (its exact class selects the table)
+
+        Returns:
+            int: Index of the vehicle in its table
+        """
+        table = self.table(type(vehicle))
+        return table.append(tuple(getattr(vehicle, field) for field in table.fields))
+
+    def add_many(self, vehicles):
+        """
+        Store many vehicles.
+
+        Args:
+            vehicles (iterable): The vehicles
+        """
+        for vehicle in vehicles:
+            self.add(vehicle)
+
+    def add_rows(self, cls, rows):
+        """
+        Store vehicles of one class from constructor values, without creating objects.
+
+        Args:
+            cls (type): Class of the vehicles
+            rows (iterable): Tuples of constructor values
+        """
+        table = self.table(cls)
+        for row in rows:
+            table.append(row)
+
+    def _tables(self, cls, fields):
+        """Tables of cls or its subclasses that have every field."""
+        return [table for table in self.tables.values()
+                if issubclass(table.cls, cls) and all(field in table.columns for field in fields)]
+
+    def _count(self, tables, filters):
+        """Count the rows matching filters in some tables."""
+        total = 0
+        for table in tables:
+            mask = table.mask(filters)
+            total += len(table) if mask is None else mask.count(1)
+        return total
+
+    def _check_field(self, field, number=False):
+        """Raise KeyError for unknown fields and ValueError for text fields used as numbers."""
+        if field not in FIELD_TYPES:
+            raise KeyError(f"Unknown field {field}")
+        if number and FIELD_TYPES[field] is str:
+            raise ValueError(f"{field} is not a number field")
+
+    def count(self, cls=Vehicle, **filters):
+        """
+        Count vehicles of a class (and its subclasses) matching filters.
+
+        Args:
+            cls (type): Class of the vehicles
+            **filters: Field values the vehicles must have
+
+        Returns:
+            int: Number of matching vehicles
+        """
+        return self._count(self._tables(cls, filters), filters)
+
+    def total(self, cls, field, **filters):
+        """
+        Sum a number field over the matching vehicles.
+
+        Args:
+            cls (type): Class of the vehicles
+            field (str): A number field (cc, load_capacity or battery_wh)
+            **filters: Field values the vehicles must have
+
+        Returns:
+            int: The sum (a float for battery_wh)
+
+        Raises:
+            KeyError: If field is unknown
+            ValueError: If field is not a number field
+        """
+        self._check_field(field, number=True)
+        return sum(sum(table.selected(field, filters)) for table in self._tables(cls, [field, *filters]))
+
+    def mean(self, cls, field, **filters):
+        """
+        Average a number field over the matching vehicles.
+
+        Returns:
+            float: The average, or 0.0 when no vehicle matches
+        """
+        count = self._count(self._tables(cls, [field, *filters]), filters)
+        return self.total(cls, field, **filters) / count if count else 0.0
+
+    def total_energy(self, cls=ElectricCar, **filters):
+        """
+        Add up the battery capacity of the matching electric vehicles.
+
+        Args:
+            cls (type): Class of the vehicles
+            **filters: Field values the vehicles must have
+
+        Returns:
+            Energy: The total capacity
+        """
+        return Energy(self.total(cls, "battery_wh", **filters))
+
+    def _group(self, cls, field, by, filters):
+        """Accumulate {group code: [sum, count]} for a number field."""
+        self._check_field(field, number=True)
+        self._check_field(by)
+        groups = {}
+        for table in self._tables(cls, [field, by, *filters]):
+            mask = table.mask(filters)
+            keys = table.columns[by]
+            values = table.columns[field]
+            pairs = zip(keys, values) if mask is None else compress(zip(keys, values), mask)
+            for key, value in pairs:
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = [value, 1]
+                else:
+                    group[0] += value
+                    group[1] += 1
+        dictionary = self.dictionaries.get(by)
+        if dictionary is None:
+            return groups
+        return {dictionary.values[key]: group for key, group in groups.items()}
+
+    def mean_by(self, cls, field, by, **filters):
+        """
+        Average a number field per value of another field.
+
+        Args:
+            cls (type): Class of the vehicles
+            field (str): A number field (cc, load_capacity or battery_wh)
+            by (str): Field to group by (for example brand)
+            **filters: Field values the vehicles must have
+
+        Returns:
+            dict: Average of each group
+        """
+        return {key: total / count for key, (total, count) in self._group(cls, field, by, filters).items()}
+
+    def count_by(self, cls, field, by, **filters):
+        """
+        Count the vehicles that have a field, per value of another field.
+
+        Returns:
+            dict: Number of vehicles in each group
+        """
+        return {key: count for key, (total, count) in self._group(cls, field, by, filters).items()}
+
+    def vehicle(self, cls, index):
+        """
+        Get a lazy view of a stored vehicle.
+
+        Args:
+            cls (type): Exact class of the vehicle
+            index (int): Index of the vehicle in its table
+
+        Returns:
+            Vehicle: A row view, instance of a subclass of cls
+
+        Raises:
+            IndexError: If there is no vehicle at that index
+        """
+        table = self.table(cls)
+        if not 0 <= index < len(table):
+            raise IndexError(f"No {cls.__name__} at index {index}")
+        return table.row_class()(table, index)
+
+    def vehicles(self, cls=Vehicle):
+        """
+        Iterate over lazy views of every vehicle of a class and its subclasses.
+
+        Args:
+            cls (type): Class of the vehicles
+
+        Yields:
+            Vehicle: Row views, table by table
+        """
+        for table in list(self.tables.values()):
+            if issubclass(table.cls, cls):
+                row_class = table.row_class()
+                for index in range(len(table)):
+                    yield row_class(table, index)
+
+
+BRANDS = {
+    Vehicle: [("Generic", "Base")],
+    Car: [("Toyota", "Corolla"), ("Ford", "Focus"), ("Renault", "Clio"), ("Fiat", "Cronos")],
+    Motorcycle: [("Honda", "CB500"), ("Yamaha", "MT-07"), ("Kawasaki", "Z900"), ("Ducati", "Monster")],
+    Truck: [("Ford", "F-150"), ("Volvo", "FH16"), ("Scania", "R500"), ("Iveco", "Stralis")],
+    ElectricCar: [("Tesla", "Model 3"), ("Nissan", "Leaf"), ("BYD", "Dolphin"), ("Renault", "Zoe")],
+}
+COLORS = ["Black", "White", "Red", "Blue", "Gray"]
+
+
+def generate_vehicle_rows(cls, n, seed=None):
+    """
+    Generate random constructor values for benchmarks, one row at a time.
+
+    Args:
+        cls (type): Class of the vehicles
+        n (int): Number of rows
+        seed: Seed for reproducible rows
+
+    Yields:
+        tuple: Constructor values of one vehicle
+    """
+    rng = random.Random(seed)
+    models = BRANDS[cls]
+    for _ in range(n):
+        brand, model = rng.choice(models)
+        if cls is Vehicle:
+            yield brand, model
+        elif cls is Motorcycle:
+            yield brand, model, rng.choice((125, 250, 500, 689, 900))
+        elif cls is Truck:
+            yield brand, model, rng.choice(COLORS), rng.randrange(500, 40000, 500)
+        elif cls is ElectricCar:
+            yield brand, model, rng.choice(COLORS), f"{rng.choice((40, 60, 75, 100))}kWh"
+        else:
+            yield brand, model, rng.choice(COLORS)
+
+
+def generate_inventory(n, seed=None):
+    """
+    Build an inventory with n vehicles spread over every class.
+
+    Args:
+        n (int): Number of vehicles
+        seed: Seed for reproducible inventories
+
+    Returns:
+        Inventory: The inventory
+    """
+    inventory = Inventory()
+    classes = [Car, Motorcycle, Truck, ElectricCar]
+    for offset, cls in enumerate(classes):
+        count = n // len(classes) + (offset < n % len(classes))
+        inventory.add_rows(cls, generate_vehicle_rows(cls, count, None if seed is None else seed + offset))
+    return inventory
+
+
+def memory_report(n=200000):
+    """Compare the memory of n vehicle objects with an Inventory of the same vehicles."""
+    classes = [Car, Motorcycle, Truck, ElectricCar]
+    tracemalloc.start()
+    vehicles = [cls(*row) for cls in classes for row in generate_vehicle_rows(cls, n // len(classes), 1)]
+    objects_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del vehicles
+
+    tracemalloc.start()
+    inventory = generate_inventory(n, 1)
+    table_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del inventory
+
+    print(f"Objects: {objects_size / n:.0f} bytes per vehicle")
+    print(f"Inventory: {table_size / n:.0f} bytes per vehicle")
+
+
+def main():
+    """Query a large inventory without creating vehicle objects."""
+    inventory = generate_inventory(1000000, seed=1)
+    print(f"{len(inventory)} vehicles in {len(inventory.tables)} tables")
+
+    start = time.perf_counter()
+    print("Total load capacity of Ford trucks:", inventory.total(Truck, "load_capacity", brand="Ford"))
+    print("Mean cc by brand:", inventory.mean_by(Motorcycle, "cc", "brand"))
+    print("Red cars (including trucks and electric cars):", inventory.count(Car, color="Red"))
+    print("Total battery capacity:", inventory.total_energy())
+    print("Electric cars with 60-80kWh:", inventory.count(ElectricCar, battery_wh=(60000, 80000)))
+    print(f"Queries in {time.perf_counter() - start:.3f}s")
+
+    truck = inventory.vehicle(Truck, 0)
+    truck.see_load_capacity()
+    next(inventory.vehicles(ElectricCar)).see_info()
+
+    memory_report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+"""
+Vehicle Serialization Documentation
+
+Overview:
+This module writes vehicles (Inheritance.py) as compact binary records and
+reads them back. It is smaller and faster than pickle or JSON because each
+class has a fixed record layout and every distinct string is written once.
+
+Schemas:
+The schema of each class is derived from its constructor: the parameter
+names come from inspect.signature and their types from the annotations or,
+when there are none, from the "name (type):" lines of the constructor
+docstring. Each field is stored from the attribute with the same name:
+- str: uint32 index into the string table
+- int: int64
+- float: float64
+- bool: one byte
+
+Batch Format (little-endian):
+- Header: magic b"VHS1", number of strings, number of records (uint32 each)
+- String table: the byte length of every string (uint32 each), then the UTF-8 bytes
+- Class IDs: one byte per record, in the original order
+- Records: for each class ID in increasing order, its records packed back to back
+
+Invalid data raises ValueError in both directions: a field value that does
+not fit its type when encoding, and a truncated batch, an out-of-range string
+index, invalid UTF-8 text or a battery that parse_energy rejects when decoding.
+Decoding skips __init__, so the fields in VALIDATORS are checked instead: each
+distinct value once per batch.
+
+Decoding works on any buffer (bytes, bytearray, mmap or memoryview) through
+a memoryview, so records are unpacked in place without copying the buffer.
+Objects are rebuilt the way pickle does: without calling __init__, by
+filling the attributes named after the constructor parameters.
+
+Both directions work column by column for each class (map, zip and
+struct.iter_unpack), so the per-vehicle work runs in C. With pause_gc=True
+the cyclic garbage collector is paused meanwhile: batches only create acyclic
+objects, and its passes over the many temporary tuples can double decoding
+time. It is off by default because the pause affects every thread of the
+process; benchmark() turns it on.
+
+Functions:
+- encode_batch / decode_batch: A whole list of vehicles
+- encode / decode: A single vehicle
+- benchmark: Compares size and speed with pickle and JSON
+
+Usage Example:
+data = encode_batch([truck1, car1])
+vehicles = decode_batch(memoryview(data))  # [Truck(...), ElectricCar(...)]
+decode(encode(truck1)).see_load_capacity()  # Same output as truck1
+"""
+
+import gc
+import inspect
+import json
+import pickle
+import re
+import struct
+import time
+from contextlib import contextmanager
+from itertools import repeat, starmap
+from operator import attrgetter
+
+from Inheritance import Car, ElectricCar, Motorcycle, Truck, Vehicle
+from units import parse_energy
+
+# Classes that can be serialized; the position of a class is its class ID
+CLASSES = (Vehicle, Car, Motorcycle, Truck, ElectricCar)
+
+MAGIC = b"VHS1"
+HEADER = struct.Struct("<4sII")
+FORMATS = {"str": "I", "int": "q", "float": "d", "bool": "?"}
+
+# Checks run on decoded text fields (they raise ValueError for invalid values)
+VALIDATORS = {"battery": parse_energy}
+
+ARGUMENT = re.compile(r"^\s*(\w+) \((\w+)\):", re.MULTILINE)
+
+
+class Schema:
+    """
+    A class to describe the binary record of one class.
+
+    Attributes:
+        cls (type): The described class
+        class_id (int): Byte identifying the class in a batch
+        fields (tuple): Constructor parameter names, in order
+        kinds (tuple): Type name of each field (str, int, float or bool)
+        struct (Struct): Packs and unpacks one record
+        text_fields (tuple): Positions of the str fields
+        getter (attrgetter): Reads the field values of a vehicle as a tuple
+    """
+
+    def __init__(self, cls, class_id):
+        """
+        Derive the schema of a class from its constructor.
+
+        Args:
+            cls (type): The class
+            class_id (int): Byte identifying the class in a batch
+
+        Raises:
+            ValueError: If the type of a constructor parameter is unknown
+        """
+        self.cls = cls
+        self.class_id = class_id
+        documented = dict(ARGUMENT.findall(inspect.getdoc(cls.__init__) or ""))
+        fields = []
+        kinds = []
+        for name, parameter in list(inspect.signature(cls.__init__).parameters.items())[1:]:
+            if parameter.annotation is not inspect.Parameter.empty:
+                kind = getattr(parameter.annotation, "__name__", str(parameter.annotation))
+            else:
+                kind = documented.get(name)
+            if kind not in FORMATS:
+                raise ValueError(f"Cannot serialize {cls.__name__}.{name} of type {kind}")
+            fields.append(name)
+            kinds.append(kind)
+        self.fields = tuple(fields)
+        self.kinds = tuple(kinds)
+        self.struct = struct.Struct("<" + "".join(FORMATS[kind] for kind in kinds))
+        self.text_fields = tuple(index for index, kind in enumerate(kinds) if kind == "str")
+        self.getter = attrgetter(*fields) if len(fields) > 1 else lambda vehicle: (getattr(vehicle, fields[0]),)
+
+    def pack(self, vehicles, strings):
+        """
+        Pack the records of vehicles of this class, adding their texts to the string table.
+
+        Args:
+            vehicles (list): Vehicles of this class
+            strings (StringTable): Index of each string in the table
+
+        Returns:
+            bytes: The records, back to back
+
+        Raises:
+            ValueError: If a field value does not fit the field's type
+        """
+        columns = list(zip(*map(self.getter, vehicles)))
+        for index in self.text_fields:
+            columns[index] = map(strings.__getitem__, columns[index])
+        try:
+            return b"".join(starmap(self.struct.pack, zip(*columns)))
+        except (struct.error, TypeError) as error:
+            fields = ", ".join(f"{name} ({kind})" for name, kind in zip(self.fields, self.kinds))
+            raise ValueError(f"Cannot encode {self.cls.__name__} with fields {fields}: {error}") from error
+
+    def unpack(self, records, strings):
+        """
+        Rebuild the vehicles of packed records.
+
+        Args:
+            records (memoryview): Records written by pack
+            strings (list): The decoded string table
+
+        Returns:
+            list: The vehicles
+
+        Raises:
+            IndexError: If a record refers to a string outside the table
+            ValueError: If a field in VALIDATORS has an invalid value
+        """
+        count = len(records) // self.struct.size
+        columns = list(zip(*self.struct.iter_unpack(records)))
+        for index in self.text_fields:
+            validate = VALIDATORS.get(self.fields[index])
+            if validate is not None:
+                for string_index in set(columns[index]):
+                    validate(strings[string_index])
+        for index in self.text_fields:
+            columns[index] = map(strings.__getitem__, columns[index])
+        attributes = map(dict, map(zip, repeat(self.fields), zip(*columns)))
+        vehicles = list(map(object.__new__, repeat(self.cls, count)))
+        list(map(setattr, vehicles, repeat("__dict__"), attributes))
+        return vehicles
+
+
+class StringTable(dict):
+    """A dictionary that gives each new string the next index."""
+
+    def __missing__(self, text):
+        index = self[text] = len(self)
+        return index
+
+
+@contextmanager
+def _paused_gc(pause=True):
+    """Pause the cyclic garbage collector if asked, restoring its previous state afterwards."""
+    if not pause:
+        yield
+        return
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+SCHEMAS = {cls: Schema(cls, class_id) for class_id, cls in enumerate(CLASSES)}
+SCHEMAS_BY_ID = {schema.class_id: schema for schema in SCHEMAS.values()}
+
+
+def encode_batch(vehicles, pause_gc=False):
+    """
+    Encode a list of vehicles.
+
+    Args:
+        vehicles (iterable): Vehicles of the classes in CLASSES
+        pause_gc (bool): Pause the cyclic garbage collector (for every thread)
+            while packing, which speeds up large batches
+
+    Returns:
+        bytes: The encoded batch
+
+    Raises:
+        KeyError: If a vehicle's class cannot be serialized
+        ValueError: If a field value does not fit the field's type
+    """
+    vehicles = list(vehicles)
+    classes = list(map(type, vehicles))
+    groups : dict[type, list] = {}
+    for cls in set(classes):
+        if cls not in SCHEMAS:
+            raise KeyError(f"{cls.__name__} cannot be serialized")
+        groups[cls] = []
+    for cls, vehicle in zip(classes, vehicles):
+        groups[cls].append(vehicle)
+    class_ids = bytes(map({cls: SCHEMAS[cls].class_id for cls in groups}.__getitem__, classes))
+    strings = StringTable()
+    with _paused_gc(pause_gc):
+        sections = {SCHEMAS[cls].class_id: SCHEMAS[cls].pack(group, strings) for cls, group in groups.items()}
+    try:
+        texts = [text.encode("utf-8") for text in strings]
+    except AttributeError as error:
+        raise ValueError(f"Text fields must be str: {error}") from error
+    parts = [
+        HEADER.pack(MAGIC, len(texts), len(class_ids)),
+        struct.pack(f"<{len(texts)}I", *map(len, texts)),
+        *texts,
+        class_ids,
+        *(sections[class_id] for class_id in sorted(sections)),
+    ]
+    return b"".join(parts)
+
+
+def decode_batch(data, pause_gc=False):
+    """
+    Decode a batch written by encode_batch.
+
+    Args:
+        data: Buffer with the batch (bytes, bytearray, mmap or memoryview)
+        pause_gc (bool): Pause the cyclic garbage collector (for every thread)
+            while rebuilding the vehicles, which speeds up large batches
+
+    Returns:
+        list: The vehicles, in their original order
+
+    Raises:
+        ValueError: If the data is not a valid batch (wrong magic, truncated,
+            unknown class ID, string index out of range, invalid UTF-8 or
+            a field rejected by VALIDATORS)
+    """
+    view = memoryview(data)
+    try:
+        magic, string_count, record_count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a vehicle batch")
+        offset = HEADER.size
+        lengths = struct.unpack_from(f"<{string_count}I", view, offset)
+        offset += 4 * string_count
+        strings = []
+        for length in lengths:
+            strings.append(str(view[offset:offset + length], "utf-8"))
+            offset += length
+        class_ids = bytes(view[offset:offset + record_count])
+        offset += record_count
+        if len(class_ids) != record_count:
+            raise ValueError("Truncated vehicle batch")
+        rows = {}
+        for class_id in sorted(set(class_ids)):
+            schema = SCHEMAS_BY_ID.get(class_id)
+            if schema is None:
+                raise ValueError(f"Unknown class ID {class_id}")
+            size = schema.struct.size * class_ids.count(class_id)
+            records = view[offset:offset + size]
+            if len(records) != size:
+                raise ValueError("Truncated vehicle batch")
+            with _paused_gc(pause_gc):
+                rows[class_id] = iter(schema.unpack(records, strings))
+            offset += size
+    except struct.error as error:
+        raise ValueError("Truncated vehicle batch") from error
+    except IndexError as error:
+        raise ValueError("Corrupted vehicle batch: string index out of range") from error
+    except UnicodeDecodeError as error:
+        raise ValueError(f"Corrupted vehicle batch: invalid UTF-8 text ({error.reason})") from error
+    # Take each vehicle from its class in the original order
+    with _paused_gc(pause_gc):
+        return list(map(next, map(rows.__getitem__, class_ids)))
+
+
+def encode(vehicle):
+    """
+    Encode a single vehicle.
+
+    Args:
+        vehicle (Vehicle): The vehicle
+
+    Returns:
+        bytes: The encoded vehicle (a batch of one)
+    """
+    return encode_batch([vehicle])
+
+
+def decode(data):
+    """
+    Decode a single vehicle written by encode.
+
+    Args:
+        data: Buffer with the encoded vehicle
+
+    Returns:
+        Vehicle: The vehicle
+
+    Raises:
+        ValueError: If the data does not hold exactly one vehicle
+    """
+    vehicles = decode_batch(data)
+    if len(vehicles) != 1:
+        raise ValueError(f"Expected one vehicle, found {len(vehicles)}")
+    return vehicles[0]
+
+
+def _to_json(vehicles):
+    """Encode vehicles as a JSON list of objects tagged with their class name."""
+    return json.dumps([{"class": type(vehicle).__name__, **vars(vehicle)} for vehicle in vehicles]).encode("utf-8")
+
+
+def _from_json(data):
+    """Decode vehicles written by _to_json."""
+    classes = {cls.__name__: cls for cls in CLASSES}
+    vehicles = []
+    for item in json.loads(data):
+        vehicle = object.__new__(classes[item.pop("class")])
+        vehicle.__dict__.update(item)
+        vehicles.append(vehicle)
+    return vehicles
+
+
+def benchmark(n=100000, seed=1):
+    """
+    Compare encoded size and speed with pickle and JSON.
+
+    Args:
+        n (int): Number of vehicles
+        seed: Seed for reproducible vehicles
+
+    Returns:
+        dict: (size in bytes, encode seconds, decode seconds) of each format
+    """
+    from inventory import generate_vehicle_rows
+    classes = (Car, Motorcycle, Truck, ElectricCar)
+    vehicles = [cls(*row) for cls in classes for row in generate_vehicle_rows(cls, n // len(classes), seed)]
+    formats = {
+        "pickle": (lambda items: pickle.dumps(items, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (_to_json, _from_json),
+        "binary": (lambda items: encode_batch(items, pause_gc=True), lambda data: decode_batch(memoryview(data), pause_gc=True)),
+    }
+    results = {}
+    for name, (dump, load) in formats.items():
+        start = time.perf_counter()
+        data = dump(vehicles)
+        encoded = time.perf_counter()
+        load(data)
+        decoded = time.perf_counter()
+        results[name] = (len(data), encoded - start, decoded - encoded)
+        print(f"{name}: {len(data) / len(vehicles):.1f} bytes per vehicle, "
+              f"encode {encoded - start:.3f}s, decode {decoded - encoded:.3f}s")
+    return results
+
+
+def main():
+    """Round-trip the example vehicles and run the benchmark."""
+    truck1 = Truck('Ford', 'F-150', 'Black', 1000)
+    car1 = ElectricCar('Tesla', 'Model 3', 'Red', '100kWh')
+    data = encode_batch([truck1, car1])
+    print(f"{len(data)} bytes")
+    for vehicle in decode_batch(memoryview(data)):
+        vehicle.see_info()
+
+    benchmark()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Energy Units Documentation
+
+Overview:
+Battery capacities are written as text such as '100kWh'. This module parses
+them once into an Energy quantity stored in watt-hours (Wh), so capacities
+can be compared, sorted and added without parsing the text again.
+
+Units:
+- Wh: watt-hours (the base unit)
+- kWh: 1,000 Wh
+- MWh: 1,000,000 Wh
+Units may be separated from the number by spaces. "Wh" and the k prefix are
+case-insensitive, but the M (mega) prefix must be uppercase: '5mWh' would be
+milliwatt-hours, so it is rejected instead of being read as 5 MWh.
+
+Parse Cache:
+parse_energy keeps the most recent results in an LRU cache. A fleet usually
+repeats a few battery strings, so most calls are a cache lookup.
+
+Functions:
+- parse_energy: Parses text into an Energy (cached)
+- energy_column: Capacities of many electric vehicles as an array of Wh
+- total_energy: Sum of the capacities of many electric vehicles
+
+Usage Example:
+parse_energy('100kWh')                 # Energy(100000.0 Wh)
+parse_energy('0.1 MWh') == parse_energy('100kWh')  # True
+str(parse_energy('75000Wh'))           # '75kWh'
+total_energy(electric_cars)            # Energy of the whole fleet
+"""
+
+import re
+from array import array
+from functools import lru_cache, total_ordering
+
+UNITS = {"wh": 1.0, "kwh": 1e3, "mwh": 1e6}
+
+QUANTITY = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*([kKM]?[wW][hH])\s*")
+
+
+@total_ordering
+class Energy:
+    """
+    A class to represent an amount of energy.
+
+    Energies are immutable, so parsed values can be cached and shared.
+
+    Attributes:
+        wh (float): The energy in watt-hours
+    """
+
+    __slots__ = ("wh",)
+
+    def __init__(self, wh):
+        """
+        Initialize a new Energy instance.
+
+        Args:
+            wh (float): The energy in watt-hours
+        """
+        object.__setattr__(self, "wh", float(wh))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Energy values are immutable")
+
+    def __reduce__(self):
+        return (Energy, (self.wh,))
+
+    @property
+    def kwh(self):
+        """Return the energy in kilowatt-hours."""
+        return self.wh / UNITS["kwh"]
+
+    @property
+    def mwh(self):
+        """Return the energy in megawatt-hours."""
+        return self.wh / UNITS["mwh"]
+
+    def __eq__(self, other):
+        return isinstance(other, Energy) and self.wh == other.wh
+
+    def __lt__(self, other):
+        if not isinstance(other, Energy):
+            return NotImplemented
+        return self.wh < other.wh
+
+    def __hash__(self):
+        return hash(self.wh)
+
+    def __add__(self, other):
+        if isinstance(other, Energy):
+            return Energy(self.wh + other.wh)
+        return NotImplemented
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+    def __repr__(self):
+        return f"Energy({self.wh} Wh)"
+
+    def __str__(self):
+        for unit, name in ((UNITS["mwh"], "MWh"), (UNITS["kwh"], "kWh")):
+            if self.wh >= unit:
+                return f"{self.wh / unit:g}{name}"
+        return f"{self.wh:g}Wh"
+
+
+@lru_cache(maxsize=1024)
+def parse_energy(text):
+    """
+    Parse an energy written as a number and a unit.
+
+    Args:
+        text (str): The energy (for example '100kWh', '0.5 MWh' or '800Wh')
+
+    Returns:
+        Energy: The parsed energy
+
+    Raises:
+        ValueError: If the text is not a number followed by Wh, kWh or MWh
+    """
+    match = QUANTITY.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid energy: {text!r} (expected a number followed by Wh, kWh or MWh)")
+    return Energy(float(match.group(1)) * UNITS[match.group(2).lower()])
+
+
+def energy_column(vehicles):
+    """
+    Get the battery capacity of many electric vehicles as numbers.
+
+    Args:
+        vehicles (iterable): Objects with a battery text attribute
+
+    Returns:
+        array: The capacities in Wh, one per vehicle
+    """
+    return array("d", (parse_energy(vehicle.battery).wh for vehicle in vehicles))
+
+
+def total_energy(vehicles):
+    """
+    Add up the battery capacity of many electric vehicles.
+
+    Args:
+        vehicles (iterable): Objects with a battery text attribute
+
+    Returns:
+        Energy: The total capacity
+    """
+    return Energy(sum(energy_column(vehicles)))
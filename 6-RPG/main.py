@@ -3,8 +3,39 @@ RPG Class System with Proper Encapsulation
 
 This file implements a role-playing game system with proper encapsulation,
 inheritance, and class interactions as specified in the requirements.
+
+Validated setters (power, health, level, base damage, healing bonus) use the
+ValidatedField descriptors from 3-Encapsulation/fields.py: invalid values raise
+ValueError, and Character.set_levels() updates many characters at once
+through batch_assign(). The descriptors are private (_power, _health...): the
+public way to change those attributes is still the set_* methods. fields.py is loaded from its path, so
+the import path is left untouched.
+
+generate_characters() produces reproducible streams of enemies and allies
+for load and scale testing.
 """
 
+import importlib.util
+import os
+import random
+
+
+def _load_fields():
+    """Load 3-Encapsulation/fields.py by path, without changing sys.path."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "3-Encapsulation", "fields.py")
+    spec = importlib.util.spec_from_file_location("fields", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_fields = _load_fields()
+Clamped = _fields.Clamped
+NonNegative = _fields.NonNegative
+Positive = _fields.Positive
+ValidatedField = _fields.ValidatedField
+batch_assign = _fields.batch_assign
+
 class Weapon:
     """
     A class to represent weapons in the RPG system.
@@ -13,6 +44,8 @@ class Weapon:
         __name (str): Private weapon name
         __power (int): Private weapon power/damage
     """
+
+    _power = ValidatedField(NonNegative(), attr="_Weapon__power", label="Power")
     
     def __init__(self, name, power):
         """
@@ -40,11 +73,8 @@ class Weapon:
         self.__name = name
     
     def set_power(self, power):
-        """Set the weapon power."""
-        if power >= 0:
-            self.__power = power
-        else:
-            print("Power cannot be negative.")
+        """Set the weapon power (raises ValueError if negative)."""
+        self._power = power
     
     def display_info(self):
         """Display weapon information."""
@@ -61,6 +91,9 @@ class Character:
         __level (int): Private character level
         __weapon (Weapon): Private equipped weapon
     """
+
+    _health = ValidatedField(Clamped(0, lambda character: character.get_max_health()), attr="_Character__health", label="Health")
+    _level = ValidatedField(Positive(), attr="_Character__level", label="Level")
     
     def __init__(self, name, health, level):
         """
@@ -104,26 +137,40 @@ class Character:
         self.__name = name
     
     def set_health(self, health):
-        """Set the character's health with validation."""
-        if health < 0:
-            self.__health = 0
-        elif health > self.__max_health:
-            self.__health = self.__max_health
-        else:
-            self.__health = health
+        """Set the character's health, clamped between 0 and max health."""
+        self._health = health
     
     def set_level(self, level):
-        """Set the character's level."""
-        if level > 0:
-            self.__level = level
-        else:
-            print("Level must be positive.")
+        """Set the character's level (raises ValueError if not positive)."""
+        self._level = level
+
+    @staticmethod
+    def set_levels(characters, levels, strict=False):
+        """
+        Set the level of many characters at once.
+        
+        Every level is validated before any is assigned.
+        
+        Args:
+            characters (list): The characters
+            levels (list): One level per character
+            strict (bool): If True, assign nothing when any level is invalid
+        
+        Returns:
+            list: A Violation for every level that was not positive
+        
+        Raises:
+            ValueError: If characters and levels have different lengths
+            ValidationError: In strict mode, if any level is invalid
+        """
+        return batch_assign(characters, "_level", levels, strict)
     
-    def equip_weapon(self, weapon):
-        """Equip a weapon to the character."""
+    def equip_weapon(self, weapon, announce=True):
+        """Equip a weapon to the character (announce=False skips the message)."""
         if isinstance(weapon, Weapon):
             self.__weapon = weapon
-            print(f"{self.__name} equipped {weapon.get_name()}!")
+            if announce:
+                print(f"{self.__name} equipped {weapon.get_name()}!")
         else:
             print("Invalid weapon object.")
     
@@ -192,6 +239,8 @@ class Enemy(Character):
         __type (str): Private enemy type
         __base_damage (int): Private base damage bonus
     """
+
+    _base_damage = ValidatedField(NonNegative(), attr="_Enemy__base_damage", label="Base damage")
     
     def __init__(self, name, health, level, enemy_type):
         """
@@ -222,11 +271,8 @@ class Enemy(Character):
         self.__type = enemy_type
     
     def set_base_damage(self, damage):
-        """Set the enemy's base damage bonus."""
-        if damage >= 0:
-            self.__base_damage = damage
-        else:
-            print("Base damage cannot be negative.")
+        """Set the enemy's base damage bonus (raises ValueError if negative)."""
+        self._base_damage = damage
     
     def attack(self, target):
         """
@@ -260,6 +306,8 @@ class Ally(Character):
         __type (str): Private ally type
         __healing_bonus (int): Private healing bonus
     """
+
+    _healing_bonus = ValidatedField(NonNegative(), attr="_Ally__healing_bonus", label="Healing bonus")
     
     def __init__(self, name, health, level, ally_type):
         """
@@ -290,11 +338,8 @@ class Ally(Character):
         self.__type = ally_type
     
     def set_healing_bonus(self, bonus):
-        """Set the ally's healing bonus."""
-        if bonus >= 0:
-            self.__healing_bonus = bonus
-        else:
-            print("Healing bonus cannot be negative.")
+        """Set the ally's healing bonus (raises ValueError if negative)."""
+        self._healing_bonus = bonus
     
     def heal(self, amount):
         """
@@ -335,6 +380,39 @@ class Ally(Character):
         """Display the ally type."""
         print(f"{self.get_name()} is a {self.__type} ally.")
 
+ENEMY_TYPES = ["Zombie", "Vampire", "Undead", "Orc"]
+ALLY_TYPES = ["Warrior", "Healer", "Archer", "Mage"]
+WEAPONS = [("Iron Sword", 15), ("Battle Axe", 20), ("Healing Staff", 10), ("Long Bow", 12)]
+
+def generate_characters(n, seed=None, enemy_ratio=0.5, health=(50, 150), level=(1, 20), armed_ratio=1.0):
+    """
+    Generate a reproducible stream of Enemy and Ally characters.
+
+    Characters are produced one at a time, so memory use does not depend
+    on n. Armed characters share a small pool of Weapon objects.
+
+    Args:
+        n (int): Number of characters
+        seed (int): Random seed; the same seed always gives the same characters
+        enemy_ratio (float): Probability that a character is an Enemy
+        health (tuple): Inclusive (lowest, highest) starting health
+        level (tuple): Inclusive (lowest, highest) level
+        armed_ratio (float): Probability that a character has a weapon
+
+    Yields:
+        Character: The next Enemy or Ally
+    """
+    rng = random.Random(seed)
+    weapons = [Weapon(name, power) for name, power in WEAPONS]
+    for number in range(n):
+        if rng.random() < enemy_ratio:
+            character = Enemy(f"Enemy {number}", rng.randint(*health), rng.randint(*level), rng.choice(ENEMY_TYPES))
+        else:
+            character = Ally(f"Ally {number}", rng.randint(*health), rng.randint(*level), rng.choice(ALLY_TYPES))
+        if rng.random() < armed_ratio:
+            character.equip_weapon(rng.choice(weapons), announce=False)
+        yield character
+
 # Demo script to test all functionality
 def main():
     """Main function to demonstrate the RPG system."""
@@ -389,6 +467,17 @@ def main():
     hero.see_health()
     hero.set_health(200)  # Should set to max health
     hero.see_health()
+    try:
+        hero.set_level(0)  # Should be rejected
+    except ValueError as error:
+        print(f"Rejected: {error}")
+
+    # Batch validation
+    print("\n=== Batch Updates ===")
+    violations = Character.set_levels([hero, enemy], [6, -1])
+    print(f"Levels: {hero.get_level()}, {enemy.get_level()}")
+    for violation in violations:
+        print(f"Character {violation.index}: {violation.message}")
 
 if __name__ == "__main__":
     main()
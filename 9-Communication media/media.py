@@ -23,6 +23,9 @@ Methods:
 - __init__: Constructor - Initializes media with basic information
 - describe: Abstract method - Subclasses must implement to provide specific details
 
+Synthetic Data:
+- generate_media: Reproducible stream of Book, Magazine and Newspaper objects for load testing
+
 Usage Example:
 book = Book("The Great Gatsby", "F. Scott Fitzgerald", "1925", 180, "Classic")
 magazine = Magazine("National Geographic", "National Geographic Society", "2024", "Nature", "Monthly")
@@ -33,6 +36,7 @@ for media in media_list:
     media.describe()  # Polymorphic behavior
 """
 
+import random
 from abc import ABC, abstractmethod
 
 class Media(ABC):
@@ -186,6 +190,36 @@ class Newspaper(Media):
     print(f"Today's topic is {self.topic}.")
     print(f"Remember that this newspaper is published {self.periodicity}.")
 
+GENRES = ["Classic", "Fantasy", "Mystery", "Romance", "Science Fiction"]
+TOPICS = ["Nature", "Politics", "Science", "Sports", "Technology"]
+PERIODICITIES = ["Daily", "Weekly", "Monthly"]
+
+def generate_media(n, seed=None, weights=(1, 1, 1), years=(1900, 2024), pages=(50, 1200)):
+  """
+  Generate a reproducible stream of media objects.
+  
+  Objects are produced one at a time, so memory use does not depend on n.
+  
+  Args:
+      n (int): Number of objects
+      seed (int): Random seed; the same seed always gives the same objects
+      weights (tuple): Relative weight of Book, Magazine and Newspaper
+      years (tuple): Inclusive (first, last) publication year
+      pages (tuple): Inclusive (lowest, highest) number of pages of a book
+  
+  Yields:
+      Media: The next Book, Magazine or Newspaper
+  """
+  rng = random.Random(seed)
+  kinds = (Book, Magazine, Newspaper)
+  for number in range(n):
+    kind = rng.choices(kinds, weights)[0]
+    date = str(rng.randint(*years))
+    if kind is Book:
+      yield Book(f"Book {number}", f"Author {rng.randrange(n // 10 + 1)}", date, rng.randint(*pages), rng.choice(GENRES))
+    else:
+      yield kind(f"{kind.__name__} {number}", f"Publisher {rng.randrange(n // 100 + 1)}", date, rng.choice(TOPICS), rng.choice(PERIODICITIES))
+
 def main():
   """
   Main function to demonstrate polymorphism with different media types.